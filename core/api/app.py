@@ -7,12 +7,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from ..config import get_settings
+from ..models import warm_up_models
 from .v1 import accounts, compliance, customers, payments, regulatory, transactions
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     get_settings()
+    warm_up_models()
 
     app = FastAPI(
         title="BaaS Core Banking API",
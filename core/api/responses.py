@@ -0,0 +1,11 @@
+"""
+Shared response classes for API routes
+"""
+
+from fastapi import Response
+
+
+class JSONBytesResponse(Response):
+    """JSON response for bodies already serialized to bytes by pydantic-core"""
+
+    media_type = "application/json"
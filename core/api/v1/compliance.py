@@ -16,6 +16,7 @@ from ...models.compliance import (
 from ...models.payment import PaymentMethod
 from ...models.rules import (
     ComplianceRule,
+    ConditionsLogic,
     RuleAction,
     RuleCondition,
     RuleSeverity,
@@ -75,7 +76,7 @@ class CreateRuleRequest(BaseModel):
     description: str = Field(..., description="Rule description")
     rule_type: RuleType = Field(..., description="Rule type")
     conditions: list[RuleCondition] = Field(default_factory=list, description="Rule conditions")
-    conditions_logic: str = Field(default="AND", description="AND or OR")
+    conditions_logic: ConditionsLogic = Field(default=ConditionsLogic.AND, description="AND or OR")
     action: RuleAction = Field(..., description="Action when triggered")
     severity: RuleSeverity = Field(..., description="Severity level")
     risk_score_impact: int = Field(default=0, ge=0, le=100, description="Risk score impact")
@@ -284,7 +285,7 @@ async def create_compliance_rule(
         Created ComplianceRule
     """
     import secrets
-    from datetime import datetime
+    from datetime import UTC, datetime
 
     rule = ComplianceRule(
         id=f"rule_{secrets.token_hex(12)}",
@@ -300,7 +301,7 @@ async def create_compliance_rule(
         message=request.message,
         enabled=request.enabled,
         priority=request.priority,
-        created_at=datetime.utcnow(),
+        created_at=datetime.now(UTC),
     )
 
     await compliance_service.create_rule(
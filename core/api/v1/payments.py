@@ -18,7 +18,7 @@ router = APIRouter(prefix="/payments", tags=["payments"])
 # Request/Response schemas
 class CreatePaymentRequest(BaseModel):
     from_account_id: str = Field(..., description="Source account")
-    amount: Decimal = Field(..., gt=0, description="Payment amount")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Payment amount")
     currency: str = Field(default="USD", description="Currency")
     payment_method: PaymentMethod = Field(..., description="Payment method")
     destination: str = Field(..., description="Payment destination")
@@ -30,7 +30,7 @@ class ACHPaymentRequest(BaseModel):
     from_account_id: str = Field(..., description="Source account")
     routing_number: str = Field(..., description="Routing number")
     account_number: str = Field(..., description="Account number")
-    amount: Decimal = Field(..., gt=0, description="Amount")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Amount")
     currency: str = Field(default="USD", description="Currency")
     description: str | None = Field(default=None, description="Description")
 
@@ -39,7 +39,7 @@ class WirePaymentRequest(BaseModel):
     from_account_id: str = Field(..., description="Source account")
     beneficiary_account: str = Field(..., description="Beneficiary account")
     swift_code: str = Field(..., description="SWIFT/BIC code")
-    amount: Decimal = Field(..., gt=0, description="Amount")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Amount")
     currency: str = Field(default="USD", description="Currency")
     description: str | None = Field(default=None, description="Description")
 
@@ -56,7 +56,7 @@ class MobileMoneyPaymentRequest(BaseModel):
         min_length=2,
         max_length=2,
     )
-    amount: Decimal = Field(..., gt=0, description="Amount")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Amount")
     currency: str = Field(..., description="Currency (e.g., KES, UGX, TZS)")
     description: str | None = Field(default=None, description="Description")
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
@@ -8,7 +8,7 @@ Provides endpoints for:
 - Report listing and retrieval
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -24,10 +24,13 @@ from ...models.regulatory import (
     ReportType,
     SuspiciousActivityReport,
     SuspiciousActivityType,
+    dump_report,
+    dump_report_summaries,
 )
 from ...repositories.formance import FormanceRepository
 from ...services.regulatory import RegulatoryReportingService
 from ..dependencies import get_formance_repository
+from ..responses import JSONBytesResponse
 
 router = APIRouter(prefix="/regulatory", tags=["regulatory"])
 
@@ -144,6 +147,7 @@ async def check_ctr_required(
 @router.post(
     "/ctr",
     response_model=CurrencyTransactionReport,
+    response_class=JSONBytesResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Generate CTR",
     description="Generate a Currency Transaction Report",
@@ -163,7 +167,7 @@ async def generate_ctr(
             prepared_by=prepared_by,
             branch_id=request.branch_id,
         )
-        return ctr
+        return JSONBytesResponse(dump_report(ctr), status_code=status.HTTP_201_CREATED)
     except RegulatoryReportError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -179,6 +183,7 @@ async def generate_ctr(
 @router.post(
     "/sar",
     response_model=SuspiciousActivityReport,
+    response_class=JSONBytesResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Generate SAR",
     description="Generate a Suspicious Activity Report",
@@ -204,7 +209,7 @@ async def generate_sar(
             alert_ids=request.alert_ids,
             priority=request.priority,
         )
-        return sar
+        return JSONBytesResponse(dump_report(sar), status_code=status.HTTP_201_CREATED)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -225,6 +230,7 @@ async def generate_sar(
 @router.get(
     "/reports",
     response_model=list[RegulatoryReportSummary],
+    response_class=JSONBytesResponse,
     summary="List reports",
     description="List regulatory reports with optional filters",
 )
@@ -249,7 +255,7 @@ async def list_reports(
             limit=limit,
             offset=offset,
         )
-        return reports
+        return JSONBytesResponse(dump_report_summaries(reports))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -260,6 +266,7 @@ async def list_reports(
 @router.get(
     "/reports/{report_id}",
     response_model=SuspiciousActivityReport | CurrencyTransactionReport,
+    response_class=JSONBytesResponse,
     summary="Get report",
     description="Get regulatory report by ID",
 )
@@ -276,7 +283,7 @@ async def get_report(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Report {report_id} not found",
             )
-        return report
+        return JSONBytesResponse(dump_report(report))
     except HTTPException:
         raise
     except Exception as e:
@@ -351,7 +358,7 @@ async def file_report(
             report_type=report_type,
             status=ReportStatus.FILED,
             bsa_identifier=bsa_identifier,
-            filed_at=datetime.utcnow(),
+            filed_at=datetime.now(UTC),
         )
     except RegulatoryReportError as e:
         raise HTTPException(
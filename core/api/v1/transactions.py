@@ -9,9 +9,15 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from ...exceptions import AccountNotFoundError, InsufficientFundsError
-from ...models.transaction import TransactionStatus, TransactionType
+from ...models.transaction import (
+    TransactionStatus,
+    TransactionType,
+    dump_transaction,
+    dump_transactions,
+)
 from ...services import TransactionService
 from ..dependencies import get_current_user, get_transaction_service
+from ..responses import JSONBytesResponse
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
@@ -19,7 +25,7 @@ router = APIRouter(prefix="/transactions", tags=["transactions"])
 # Request/Response schemas
 class DepositRequest(BaseModel):
     to_account_id: str = Field(..., description="Destination account")
-    amount: Decimal = Field(..., gt=0, description="Amount to deposit")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Amount to deposit")
     currency: str = Field(default="USD", description="Currency")
     description: str | None = Field(default=None, description="Description")
     metadata: dict = Field(default_factory=dict, description="Metadata")
@@ -27,7 +33,7 @@ class DepositRequest(BaseModel):
 
 class WithdrawalRequest(BaseModel):
     from_account_id: str = Field(..., description="Source account")
-    amount: Decimal = Field(..., gt=0, description="Amount to withdraw")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Amount to withdraw")
     currency: str = Field(default="USD", description="Currency")
     description: str | None = Field(default=None, description="Description")
     metadata: dict = Field(default_factory=dict, description="Metadata")
@@ -36,7 +42,7 @@ class WithdrawalRequest(BaseModel):
 class TransferRequest(BaseModel):
     from_account_id: str = Field(..., description="Source account")
     to_account_id: str = Field(..., description="Destination account")
-    amount: Decimal = Field(..., gt=0, description="Amount to transfer")
+    amount: Decimal = Field(..., gt=0, decimal_places=2, description="Amount to transfer")
     currency: str = Field(default="USD", description="Currency")
     description: str | None = Field(default=None, description="Description")
     metadata: dict = Field(default_factory=dict, description="Metadata")
@@ -54,6 +60,10 @@ class TransactionResponse(BaseModel):
     reference: str | None
 
 
+# Fields serialized straight from Transaction on read endpoints
+_TRANSACTION_RESPONSE_FIELDS = frozenset(TransactionResponse.model_fields)
+
+
 @router.post("/deposit", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_deposit(
     request: DepositRequest,
@@ -134,7 +144,9 @@ async def create_transfer(
         )
 
 
-@router.get("/{transaction_id}", response_model=TransactionResponse)
+@router.get(
+    "/{transaction_id}", response_model=TransactionResponse, response_class=JSONBytesResponse
+)
 async def get_transaction(
     transaction_id: str,
     service: Annotated[TransactionService, Depends(get_transaction_service)],
@@ -143,7 +155,7 @@ async def get_transaction(
     """Get transaction by ID"""
     try:
         transaction = await service.get_transaction(transaction_id)
-        return transaction
+        return JSONBytesResponse(dump_transaction(transaction, _TRANSACTION_RESPONSE_FIELDS))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -151,7 +163,11 @@ async def get_transaction(
         )
 
 
-@router.get("/account/{account_id}", response_model=list[TransactionResponse])
+@router.get(
+    "/account/{account_id}",
+    response_model=list[TransactionResponse],
+    response_class=JSONBytesResponse,
+)
 async def list_account_transactions(
     account_id: str,
     service: Annotated[TransactionService, Depends(get_transaction_service)],
@@ -166,7 +182,7 @@ async def list_account_transactions(
             limit=limit,
             offset=offset,
         )
-        return transactions
+        return JSONBytesResponse(dump_transactions(transactions, _TRANSACTION_RESPONSE_FIELDS))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
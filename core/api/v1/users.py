@@ -7,9 +7,10 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, EmailStr, Field
 
-from ...models.user import Permission, UserRole, UserStatus
+from ...models.user import Permission, UserRole, UserStatus, dump_user, dump_users
 from ...services.users import UserService
 from ..dependencies import get_current_user, get_user_service
+from ..responses import JSONBytesResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -67,6 +68,10 @@ class UserResponse(BaseModel):
     two_factor_enabled: bool
 
 
+# Fields serialized straight from User on read endpoints
+_USER_RESPONSE_FIELDS = frozenset(UserResponse.model_fields)
+
+
 class LoginResponse(BaseModel):
     user: UserResponse
     token: str
@@ -146,7 +151,7 @@ async def logout(
         )
 
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get("/{user_id}", response_model=UserResponse, response_class=JSONBytesResponse)
 async def get_user(
     user_id: str,
     service: Annotated[UserService, Depends(get_user_service)],
@@ -155,7 +160,7 @@ async def get_user(
     """Get user by ID"""
     try:
         user = await service.get_user(user_id)
-        return user
+        return JSONBytesResponse(dump_user(user, _USER_RESPONSE_FIELDS))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -163,7 +168,11 @@ async def get_user(
         )
 
 
-@router.get("/organization/{organization_id}", response_model=list[UserResponse])
+@router.get(
+    "/organization/{organization_id}",
+    response_model=list[UserResponse],
+    response_class=JSONBytesResponse,
+)
 async def list_organization_users(
     organization_id: str,
     service: Annotated[UserService, Depends(get_user_service)],
@@ -182,7 +191,7 @@ async def list_organization_users(
             status=user_status,
             role=user_role,
         )
-        return users
+        return JSONBytesResponse(dump_users(users, _USER_RESPONSE_FIELDS))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
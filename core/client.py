@@ -62,7 +62,7 @@ class CustomAsyncClient(AsyncHttpClient):
         content: httpx._types.RequestContent | None = None,
         data: httpx._types.RequestData | None = None,
         files: httpx._types.RequestFiles | None = None,
-        json: any | None = None,
+        json: "any | None" = None,
         params: httpx._types.QueryParamTypes | None = None,
         headers: httpx._types.HeaderTypes | None = None,
         cookies: httpx._types.CookieTypes | None = None,
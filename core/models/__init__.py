@@ -5,9 +5,40 @@ Domain models for banking entities
 from .account import Account, AccountStatus, AccountType
 from .card import Card, CardStatus, CardType
 from .customer import Customer, CustomerStatus, KYCStatus
+from .organization import Organization
 from .payment import Payment, PaymentMethod, PaymentStatus
+from .regulatory import (
+    CurrencyTransactionReport,
+    EntitySubject,
+    FinancialInstitution,
+    IndividualSubject,
+    SuspiciousActivityReport,
+    TransactionDetails,
+    UnknownSubject,
+)
 from .transaction import Transaction, TransactionStatus, TransactionType
 
+# Models whose schemas are built lazily (defer_build=True) but sit on request paths
+_DEFERRED_MODELS = (
+    Customer,
+    Organization,
+    Payment,
+    FinancialInstitution,
+    IndividualSubject,
+    EntitySubject,
+    UnknownSubject,
+    TransactionDetails,
+    SuspiciousActivityReport,
+    CurrencyTransactionReport,
+)
+
+
+def warm_up_models() -> None:
+    """Build deferred model schemas up front so the first request doesn't pay for it"""
+    for model in _DEFERRED_MODELS:
+        model.model_rebuild(force=True)
+
+
 __all__ = [
     "Account",
     "AccountType",
@@ -24,4 +55,5 @@ __all__ = [
     "Card",
     "CardType",
     "CardStatus",
+    "warm_up_models",
 ]
@@ -0,0 +1,135 @@
+"""
+Shared annotated field types and defaults for domain models
+"""
+
+import sys
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, StringConstraints
+
+# ISO 3166-1 alpha-2 country codes, built once at import
+ISO_3166_ALPHA2: frozenset[str] = frozenset(
+    """
+    AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ BA BB BD BE BF BG BH BI BJ BL BM BN BO BQ
+    BR BS BT BV BW BY BZ CA CC CD CF CG CH CI CK CL CM CN CO CR CU CV CW CX CY CZ DE DJ DK DM
+    DO DZ EC EE EG EH ER ES ET FI FJ FK FM FO FR GA GB GD GE GF GG GH GI GL GM GN GP GQ GR GS
+    GT GU GW GY HK HM HN HR HT HU ID IE IL IM IN IO IQ IR IS IT JE JM JO JP KE KG KH KI KM KN
+    KP KR KW KY KZ LA LB LC LI LK LR LS LT LU LV LY MA MC MD ME MF MG MH MK ML MM MN MO MP MQ
+    MR MS MT MU MV MW MX MY MZ NA NC NE NF NG NI NL NO NP NR NU NZ OM PA PE PF PG PH PK PL PM
+    PN PR PS PT PW PY QA RE RO RS RU RW SA SB SC SD SE SG SH SI SJ SK SL SM SN SO SR SS ST SV
+    SX SY SZ TC TD TF TG TH TJ TK TL TM TN TO TR TT TV TW TZ UA UG UM US UY UZ VA VC VE VG VI
+    VN VU WF WS YE YT ZA ZM ZW
+    """.split()
+)
+
+
+def _check_country_code(value: str) -> str:
+    """Validate an ISO 3166-1 alpha-2 country code, normalized to upper case"""
+    code = value.upper()
+    if code not in ISO_3166_ALPHA2:
+        raise ValueError(f"Invalid country code: {value}. Must be an ISO 3166-1 alpha-2 code")
+    return code
+
+
+CountryCode = Annotated[str, AfterValidator(_check_country_code)]
+
+# Lightweight structural email check shared by all models (no email-validator round trip)
+Email = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)]
+
+# E.164: "+", a non-zero leading digit, then up to 14 more digits (15 digits max)
+E164_PATTERN = r"^\+[1-9]\d{1,14}$"
+PhoneNumber = Annotated[str, StringConstraints(pattern=E164_PATTERN)]
+
+# Interned on validation so values that repeat across many records share one string
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+# ISO 4217 minor-unit exponents for currencies that don't use 2 decimal places
+_CURRENCY_EXPONENTS: dict[str, int] = {
+    **dict.fromkeys(
+        "BIF CLP DJF GNF ISK JPY KMF KRW PYG RWF UGX VND VUV XAF XOF XPF".split(), 0
+    ),
+    **dict.fromkeys("BHD IQD JOD KWD LYD OMR TND".split(), 3),
+}
+
+
+def currency_exponent(currency: str) -> int:
+    """Number of decimal places in a currency's minor unit (ISO 4217, default 2)"""
+    return _CURRENCY_EXPONENTS.get(currency.upper(), 2)
+
+
+def amount_to_minor_units(data: Any, fields: Iterable[str]) -> Any:
+    """
+    Replace a decimal ``amount`` in raw model input with integer ``amount_minor``
+
+    Shared by the ``mode="before"`` validators of models that store money in
+    minor units. Objects passed with ``from_attributes`` are read into a dict of
+    ``fields`` first. The scale is ``currency_exponent`` when given, otherwise
+    the ISO 4217 exponent of ``currency``. An ``amount`` alongside
+    ``amount_minor`` (e.g. a ``model_dump()`` round trip) must agree with it.
+    """
+    if isinstance(data, dict):
+        if "amount" not in data and "currency_exponent" in data:
+            return data
+        data = dict(data)
+    elif hasattr(data, "amount") and not hasattr(data, "amount_minor"):
+        data = {name: getattr(data, name) for name in (*fields, "amount") if hasattr(data, name)}
+    else:
+        return data
+
+    if "currency_exponent" not in data:
+        currency = data.get("currency", "USD")
+        data["currency_exponent"] = currency_exponent(currency) if isinstance(currency, str) else 2
+    if "amount" not in data:
+        return data
+
+    try:
+        amount = Decimal(str(data.pop("amount")))
+        exponent = int(data["currency_exponent"])
+    except (InvalidOperation, TypeError, ValueError) as e:
+        raise ValueError("Amount must be a decimal number with an integer currency_exponent") from e
+    if not amount.is_finite():
+        raise ValueError("Amount must be a finite decimal number")
+    minor = amount.scaleb(exponent)
+    if minor != minor.to_integral_value():
+        raise ValueError(f"Amount {amount} has more precision than the currency allows")
+    if "amount_minor" in data and data["amount_minor"] != int(minor):
+        raise ValueError(
+            f"Amount {amount} does not match amount_minor {data['amount_minor']} "
+            f"at currency_exponent {exponent}"
+        )
+    data["amount_minor"] = int(minor)
+    return data
+
+
+# Timezone-aware replacement for the deprecated datetime.utcnow as a default_factory
+utcnow = partial(datetime.now, UTC)
+
+
+class _EmptyMapping(dict):
+    """Read-only empty dict shared as the default for unset metadata/details fields"""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(
+            "Shared empty default is read-only; replace the field with a new dict "
+            "(model_copy(update=...) on frozen models)"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "_EmptyMapping":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "_EmptyMapping":
+        return self
+
+
+# Shared by every model instance that never sets these fields
+EMPTY_MAPPING = _EmptyMapping()
@@ -8,6 +8,8 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ._types import utcnow
+
 
 class AccountType(str, Enum):
     """Account types"""
@@ -41,7 +43,7 @@ class Account(BaseModel):
     balance: Decimal = Field(default=Decimal("0"), description="Current balance")
     available_balance: Decimal = Field(default=Decimal("0"), description="Available balance")
     status: AccountStatus = Field(default=AccountStatus.ACTIVE, description="Account status")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     updated_at: datetime | None = Field(default=None, description="Last update timestamp")
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
 
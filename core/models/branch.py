@@ -7,6 +7,8 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ._types import CountryCode, utcnow
+
 
 class BranchType(str, Enum):
     """Branch type"""
@@ -32,6 +34,8 @@ class BranchStatus(str, Enum):
 class BranchSettings(BaseModel):
     """Branch-specific settings"""
 
+    model_config = ConfigDict(frozen=True)
+
     # Transaction limits (can override org settings)
     max_daily_transaction_limit: float | None = Field(
         None, description="Branch-specific daily limit"
@@ -62,6 +66,10 @@ class BranchSettings(BaseModel):
     timezone: str = Field(default="UTC", description="Branch timezone")
 
 
+# Shared immutable default for branches that don't override any settings
+DEFAULT_BRANCH_SETTINGS = BranchSettings()
+
+
 class Branch(BaseModel):
     """Branch model for multi-branch organizations"""
 
@@ -89,7 +97,7 @@ class Branch(BaseModel):
     address_city: str | None = Field(None, description="City")
     address_state: str | None = Field(None, description="State/Province")
     address_postal_code: str | None = Field(None, description="Postal code")
-    address_country: str = Field(..., description="Country code (ISO 3166-1)")
+    address_country: CountryCode = Field(..., description="Country code (ISO 3166-1)")
 
     # Geolocation (for mapping/routing)
     latitude: float | None = Field(None, description="Latitude")
@@ -103,7 +111,7 @@ class Branch(BaseModel):
 
     # Settings
     settings: BranchSettings = Field(
-        default_factory=BranchSettings, description="Branch-specific settings"
+        default=DEFAULT_BRANCH_SETTINGS, description="Branch-specific settings"
     )
 
     # Statistics (cached)
@@ -112,7 +120,7 @@ class Branch(BaseModel):
     total_users: int = Field(default=0, description="Number of staff users")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     updated_at: datetime | None = Field(None, description="Last update timestamp")
     opened_at: datetime | None = Field(None, description="When branch opened for business")
     closed_at: datetime | None = Field(None, description="When branch closed")
@@ -139,9 +147,10 @@ class Branch(BaseModel):
 
         Returns the more restrictive (lower) limit
         """
-        if self.settings.max_transaction_amount and org_limit:
-            return min(self.settings.max_transaction_amount, org_limit)
-        return self.settings.max_transaction_amount or org_limit
+        branch_limit = self.settings.max_transaction_amount
+        if branch_limit and org_limit:
+            return branch_limit if branch_limit < org_limit else org_limit
+        return branch_limit or org_limit
 
     def get_effective_compliance_level(self, org_compliance_level: str) -> str:
         """
@@ -182,7 +191,7 @@ class BranchAssignment(BaseModel):
 
     # Timestamps
     assigned_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Assignment timestamp"
+        default_factory=utcnow, description="Assignment timestamp"
     )
     assigned_by: str | None = Field(None, description="Assigned by user ID")
 
@@ -222,7 +231,7 @@ class BranchPerformanceMetrics(BaseModel):
 
     # Timestamps
     calculated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Calculation timestamp"
+        default_factory=utcnow, description="Calculation timestamp"
     )
 
     # Metadata
@@ -8,6 +8,8 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ._types import utcnow
+
 
 class CardType(str, Enum):
     """Card types"""
@@ -41,7 +43,7 @@ class Card(BaseModel):
     expiry_year: int | None = Field(default=None, description="Expiry year")
     status: CardStatus = Field(default=CardStatus.PENDING, description="Card status")
     spending_limit: Decimal | None = Field(default=None, description="Daily spending limit")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     activated_at: datetime | None = Field(default=None, description="Activation timestamp")
     cancelled_at: datetime | None = Field(default=None, description="Cancellation timestamp")
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
@@ -63,7 +65,7 @@ class Card(BaseModel):
         if not self.expiry_month or not self.expiry_year:
             return False
 
-        now = datetime.utcnow()
+        now = utcnow()
         return self.expiry_year < now.year or (
             self.expiry_year == now.year and self.expiry_month < now.month
         )
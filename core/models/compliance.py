@@ -2,12 +2,16 @@
 Compliance domain models for KYC/AML and transaction monitoring
 """
 
+from bisect import bisect_right
+from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._types import CountryCode, utcnow
 
 
 class ComplianceStatus(str, Enum):
@@ -45,6 +49,11 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Upper bounds (exclusive) of the LOW/MEDIUM/HIGH score bands; anything above is CRITICAL
+_RISK_LEVEL_THRESHOLDS = (25, 50, 75)
+_RISK_LEVEL_BANDS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+
 class SanctionListType(str, Enum):
     """Sanction list types"""
 
@@ -66,6 +75,38 @@ class ComplianceAction(str, Enum):
     LOG = "log"
 
 
+class SanctionMatchSummary(BaseModel):
+    """Condensed sanction list hit embedded in a compliance check"""
+
+    model_config = ConfigDict(frozen=True)
+
+    list_type: SanctionListType = Field(..., description="Sanction list type")
+    sanction_id: str = Field(..., description="ID from sanction list")
+    match_name: str = Field(..., description="Name from sanction list")
+    match_score: float = Field(..., ge=0, le=1, description="Match confidence score (0-1)")
+    match_type: str = Field(default="exact", description="Match type: exact, fuzzy, alias")
+    program: str | None = Field(None, description="Sanctions program (e.g., SDGT, IRAN)")
+    country: CountryCode | None = Field(None, description="Country associated with sanction")
+    aliases: tuple[str, ...] = Field(default=(), description="Known aliases")
+
+
+class AlertStatus(str, Enum):
+    """Compliance alert investigation status"""
+
+    OPEN = "open"
+    INVESTIGATING = "investigating"
+    RESOLVED = "resolved"
+    FALSE_POSITIVE = "false_positive"
+
+
+class ComplianceReportStatus(str, Enum):
+    """Compliance report status"""
+
+    DRAFT = "draft"
+    SUBMITTED = "submitted"
+    FILED = "filed"
+
+
 class ComplianceCheck(BaseModel):
     """Record of a compliance check performed"""
 
@@ -82,17 +123,17 @@ class ComplianceCheck(BaseModel):
     payment_id: str | None = Field(None, description="Payment being checked")
 
     # Check details
-    rules_evaluated: list[str] = Field(
-        default_factory=list, description="Rules that were evaluated"
+    rules_evaluated: tuple[str, ...] = Field(
+        default_factory=tuple, description="Rules that were evaluated, in evaluation order"
     )
-    rules_triggered: list[str] = Field(
-        default_factory=list, description="Rules that were triggered"
+    rules_triggered: frozenset[str] = Field(
+        default_factory=frozenset, description="Rules that were triggered"
     )
     reason: str | None = Field(None, description="Reason for status")
     details: dict[str, Any] = Field(default_factory=dict, description="Additional check details")
 
     # Sanctions screening results
-    sanctions_matches: list[dict] = Field(
+    sanctions_matches: list[SanctionMatchSummary] = Field(
         default_factory=list, description="Any sanction list matches"
     )
 
@@ -107,7 +148,7 @@ class ComplianceCheck(BaseModel):
 
     # Timestamps
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When check was performed"
+        default_factory=utcnow, description="When check was performed"
     )
     expires_at: datetime | None = Field(None, description="When check expires")
 
@@ -154,14 +195,14 @@ class RiskScore(BaseModel):
     sanctions_score: int = Field(default=0, ge=0, le=100, description="Sanctions screening score")
 
     # Factors
-    risk_factors: list[str] = Field(default_factory=list, description="Risk factors identified")
+    risk_factors: tuple[str, ...] = Field(default=(), description="Risk factors identified")
 
     # Details
     details: dict[str, Any] = Field(default_factory=dict, description="Score calculation details")
 
     # Timestamps
     calculated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When score was calculated"
+        default_factory=utcnow, description="When score was calculated"
     )
     valid_until: datetime | None = Field(None, description="Score validity period")
 
@@ -180,6 +221,13 @@ class RiskScore(BaseModel):
         else:
             return RiskLevel.CRITICAL
 
+    @classmethod
+    def calculate_risk_levels(cls, scores: Iterable[int]) -> list[RiskLevel]:
+        """Calculate risk levels for a batch of scores"""
+        thresholds = _RISK_LEVEL_THRESHOLDS
+        bands = _RISK_LEVEL_BANDS
+        return [bands[bisect_right(thresholds, score)] for score in scores]
+
 
 class SanctionMatch(BaseModel):
     """Sanction list match result"""
@@ -201,8 +249,8 @@ class SanctionMatch(BaseModel):
     # Sanction details
     sanction_id: str = Field(..., description="ID from sanction list")
     program: str | None = Field(None, description="Sanctions program (e.g., SDGT, IRAN)")
-    country: str | None = Field(None, description="Country associated with sanction")
-    aliases: list[str] = Field(default_factory=list, description="Known aliases")
+    country: CountryCode | None = Field(None, description="Country associated with sanction")
+    aliases: tuple[str, ...] = Field(default_factory=tuple, description="Known aliases")
     remarks: str | None = Field(None, description="Additional remarks")
 
     # Status
@@ -212,7 +260,7 @@ class SanctionMatch(BaseModel):
 
     # Timestamps
     detected_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When match was detected"
+        default_factory=utcnow, description="When match was detected"
     )
 
     # Metadata
@@ -244,13 +292,11 @@ class VelocityCheck(BaseModel):
 
     # Status
     limit_exceeded: bool = Field(default=False, description="Whether limit was exceeded")
-    exceeded_limits: list[str] = Field(
-        default_factory=list, description="Which limits were exceeded"
-    )
+    exceeded_limits: tuple[str, ...] = Field(default=(), description="Which limits were exceeded")
 
     # Timestamps
     checked_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When check was performed"
+        default_factory=utcnow, description="When check was performed"
     )
 
     # Metadata
@@ -274,12 +320,10 @@ class ComplianceAlert(BaseModel):
     # Alert details
     title: str = Field(..., description="Alert title")
     description: str = Field(..., description="Alert description")
-    indicators: list[str] = Field(default_factory=list, description="Risk indicators")
+    indicators: tuple[str, ...] = Field(default=(), description="Risk indicators")
 
     # Status
-    status: str = Field(
-        default="open", description="Status: open, investigating, resolved, false_positive"
-    )
+    status: AlertStatus = Field(default=AlertStatus.OPEN, description="Alert status")
     assigned_to: str | None = Field(None, description="User assigned to investigate")
     resolved_by: str | None = Field(None, description="User who resolved")
     resolved_at: datetime | None = Field(None, description="When resolved")
@@ -287,7 +331,7 @@ class ComplianceAlert(BaseModel):
 
     # Timestamps
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When alert was created"
+        default_factory=utcnow, description="When alert was created"
     )
 
     # Metadata
@@ -315,13 +359,15 @@ class ComplianceReport(BaseModel):
     details: dict[str, Any] = Field(default_factory=dict, description="Report details")
 
     # Status
-    status: str = Field(default="draft", description="Status: draft, submitted, filed")
+    status: ComplianceReportStatus = Field(
+        default=ComplianceReportStatus.DRAFT, description="Report status"
+    )
     filed_by: str | None = Field(None, description="User who filed")
     filed_at: datetime | None = Field(None, description="When filed")
 
     # Timestamps
     generated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When report was generated"
+        default_factory=utcnow, description="When report was generated"
     )
 
     # Metadata
@@ -2,10 +2,15 @@
 Customer domain models
 """
 
+import sys
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+
+from ._types import EMPTY_MAPPING, CountryCode, Email, InternedStr, utcnow
 
 
 class CustomerStatus(str, Enum):
@@ -27,36 +32,87 @@ class KYCStatus(str, Enum):
     REJECTED = "rejected"
 
 
+# Bare status values for hot comparisons (instances store values via use_enum_values)
+_ACTIVE = sys.intern(CustomerStatus.ACTIVE.value)
+_KYC_VERIFIED = sys.intern(KYCStatus.VERIFIED.value)
+
+
 class Address(BaseModel):
     """Customer address"""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     street: str = Field(..., description="Street address")
     city: str = Field(..., description="City")
     state: str = Field(..., description="State/Province")
     postal_code: str = Field(..., description="Postal code")
-    country: str = Field(..., description="Country code (ISO 3166-1 alpha-2)")
+    country: CountryCode = Field(..., description="Country code (ISO 3166-1 alpha-2)")
 
 
 class Customer(BaseModel):
     """Customer model"""
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(
+        from_attributes=True, use_enum_values=True, frozen=True, defer_build=True
+    )
 
     id: str = Field(..., description="Customer identifier")
     organization_id: str = Field(..., description="Organization identifier")
     branch_id: str = Field(..., description="Branch where customer was registered")
-    email: EmailStr = Field(..., description="Customer email")
-    first_name: str = Field(..., description="First name")
-    last_name: str = Field(..., description="Last name")
+    email: Email = Field(..., description="Customer email")
+    first_name: InternedStr = Field(..., description="First name")
+    last_name: InternedStr = Field(..., description="Last name")
     phone: str | None = Field(default=None, description="Phone number")
-    address: Address | None = Field(default=None, description="Customer address")
+
+    # Address (stored flat, like Branch, to avoid a nested model per customer).
+    # Serialized only through the nested ``address`` below, so dumps keep their shape.
+    address_street: str | None = Field(default=None, description="Street address", exclude=True)
+    address_city: str | None = Field(default=None, description="City", exclude=True)
+    address_state: str | None = Field(default=None, description="State/Province", exclude=True)
+    address_postal_code: str | None = Field(default=None, description="Postal code", exclude=True)
+    address_country: CountryCode | None = Field(
+        default=None, description="Country code (ISO 3166-1 alpha-2)", exclude=True
+    )
+
     status: CustomerStatus = Field(default=CustomerStatus.ACTIVE, description="Customer status")
     kyc_status: KYCStatus = Field(
         default=KYCStatus.NOT_STARTED, description="KYC verification status"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     updated_at: datetime | None = Field(default=None, description="Last update timestamp")
-    metadata: dict = Field(default_factory=dict, description="Additional metadata")
+    metadata: Mapping[str, Any] = Field(default=EMPTY_MAPPING, description="Additional metadata")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_address(cls, data: Any) -> Any:
+        """Accept the nested ``address`` payload and spread it into the flat fields"""
+        if isinstance(data, dict) and "address" in data:
+            data = dict(data)
+            address = data.pop("address")
+            if address is not None:
+                # Validate nested input as a whole so partial addresses are rejected
+                address = Address.model_validate(address).model_dump()
+            for key, value in (address or {}).items():
+                data.setdefault(f"address_{key}", value)
+        return data
+
+    @computed_field
+    @property
+    def address(self) -> Address | None:
+        """Customer address, rebuilt from the flat address fields"""
+        parts = (
+            self.address_street,
+            self.address_city,
+            self.address_state,
+            self.address_postal_code,
+            self.address_country,
+        )
+        if any(part is None for part in parts):
+            return None
+        street, city, state, postal_code, country = parts
+        return Address(
+            street=street, city=city, state=state, postal_code=postal_code, country=country
+        )
 
     @property
     def full_name(self) -> str:
@@ -65,11 +121,11 @@ class Customer(BaseModel):
 
     def is_active(self) -> bool:
         """Check if customer is active"""
-        return self.status == CustomerStatus.ACTIVE
+        return self.status == _ACTIVE
 
     def is_kyc_verified(self) -> bool:
         """Check if customer KYC is verified"""
-        return self.kyc_status == KYCStatus.VERIFIED
+        return self.kyc_status == _KYC_VERIFIED
 
     def can_transact(self) -> bool:
         """Check if customer can perform transactions"""
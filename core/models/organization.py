@@ -2,10 +2,14 @@
 Organization domain models
 """
 
+import sys
 from datetime import datetime
 from enum import Enum
+from functools import cache
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._types import CountryCode, Email, utcnow
 
 
 class OrganizationType(str, Enum):
@@ -29,9 +33,15 @@ class OrganizationStatus(str, Enum):
     CLOSED = "closed"  # Permanently closed
 
 
+# Bare status value for hot comparisons (instances store values via use_enum_values)
+_ACTIVE = sys.intern(OrganizationStatus.ACTIVE.value)
+
+
 class OrganizationSettings(BaseModel):
     """Organization settings and preferences"""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     # Payment settings
     allow_mobile_money: bool = Field(default=True, description="Enable mobile money")
     allow_international: bool = Field(default=False, description="Enable international payments")
@@ -39,9 +49,7 @@ class OrganizationSettings(BaseModel):
     max_daily_transaction_limit: float | None = Field(
         default=None, description="Maximum daily transaction limit"
     )
-    allowed_currencies: list[str] = Field(
-        default_factory=lambda: ["USD"], description="Allowed currencies"
-    )
+    allowed_currencies: tuple[str, ...] = Field(default=("USD",), description="Allowed currencies")
     webhook_url: str | None = Field(default=None, description="Webhook URL for events")
     api_callback_url: str | None = Field(default=None, description="API callback URL")
 
@@ -61,8 +69,8 @@ class OrganizationSettings(BaseModel):
     max_transaction_amount: float | None = Field(
         default=None, description="Maximum transaction amount (hard limit)"
     )
-    restricted_countries: list[str] = Field(
-        default_factory=list, description="ISO country codes blocked for this organization"
+    restricted_countries: tuple[str, ...] = Field(
+        default=(), description="ISO country codes blocked for this organization"
     )
     require_manual_review_above: float | None = Field(
         default=None, description="Amount threshold requiring manual review"
@@ -75,16 +83,22 @@ class OrganizationSettings(BaseModel):
     )
 
 
+@cache
+def default_organization_settings() -> OrganizationSettings:
+    """Shared immutable settings for organizations that don't override any (built on first use)"""
+    return OrganizationSettings()
+
+
 class Organization(BaseModel):
     """Organization model"""
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, defer_build=True)
 
     id: str = Field(..., description="Organization identifier")
     name: str = Field(..., description="Organization name")
     legal_name: str | None = Field(default=None, description="Legal business name")
     organization_type: OrganizationType = Field(..., description="Type of organization")
-    email: EmailStr = Field(..., description="Organization contact email")
+    email: Email = Field(..., description="Organization contact email")
     phone: str | None = Field(default=None, description="Organization phone")
     website: str | None = Field(default=None, description="Organization website")
 
@@ -93,7 +107,7 @@ class Organization(BaseModel):
     address_city: str | None = Field(default=None, description="City")
     address_state: str | None = Field(default=None, description="State/Province")
     address_postal_code: str | None = Field(default=None, description="Postal code")
-    address_country: str = Field(..., description="Country code (ISO 3166-1 alpha-2)")
+    address_country: CountryCode = Field(..., description="Country code (ISO 3166-1 alpha-2)")
 
     # Business details
     tax_id: str | None = Field(default=None, description="Tax identification number")
@@ -110,18 +124,18 @@ class Organization(BaseModel):
 
     # Settings
     settings: OrganizationSettings = Field(
-        default_factory=OrganizationSettings, description="Organization settings"
+        default_factory=default_organization_settings, description="Organization settings"
     )
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     updated_at: datetime | None = Field(default=None, description="Last update timestamp")
     created_by: str | None = Field(default=None, description="Created by user ID")
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
 
     def is_active(self) -> bool:
         """Check if organization is active"""
-        return self.status == OrganizationStatus.ACTIVE
+        return self.status == _ACTIVE
 
     def is_verified(self) -> bool:
         """Check if organization KYB is verified"""
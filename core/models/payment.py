@@ -2,11 +2,17 @@
 Payment domain models
 """
 
+import sys
+from collections.abc import Mapping
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cache, cached_property
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, model_validator
+
+from ._types import EMPTY_MAPPING, CountryCode, PhoneNumber, amount_to_minor_units, utcnow
 
 
 class PaymentMethod(str, Enum):
@@ -36,6 +42,9 @@ class MobileMoneyProvider(str, Enum):
     FLUTTERWAVE = "flutterwave"  # Pan-African aggregator
 
 
+_PROVIDER_BY_VALUE = {provider.value: provider for provider in MobileMoneyProvider}
+
+
 class PaymentStatus(str, Enum):
     """Payment status"""
 
@@ -47,16 +56,31 @@ class PaymentStatus(str, Enum):
     RETURNED = "returned"
 
 
+# Bare status value for hot comparisons (instances store values via use_enum_values)
+_COMPLETED = sys.intern(PaymentStatus.COMPLETED.value)
+
+# Statuses in which a payment is still in flight. str-enum members hash and compare
+# equal to their values, so this matches validated (value) and constructed (member) status.
+_PENDING_STATUSES = frozenset({PaymentStatus.PENDING, PaymentStatus.PROCESSING})
+
+
 class Payment(BaseModel):
     """Payment model"""
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(
+        from_attributes=True, use_enum_values=True, frozen=True, defer_build=True
+    )
 
     id: str = Field(..., description="Payment identifier")
     organization_id: str = Field(..., description="Organization identifier")
     branch_id: str = Field(..., description="Branch that initiated payment")
     from_account_id: str = Field(..., description="Source account")
-    amount: Decimal = Field(..., description="Payment amount")
+    amount_minor: int = Field(..., description="Payment amount in minor currency units")
+    currency_exponent: int = Field(
+        default=2,
+        ge=0,
+        description="Decimal places of the currency (derived from the code if omitted)",
+    )
     currency: str = Field(default="USD", description="Payment currency")
     payment_method: PaymentMethod = Field(..., description="Payment method")
     destination: str = Field(..., description="Payment destination")
@@ -64,42 +88,87 @@ class Payment(BaseModel):
     description: str | None = Field(default=None, description="Payment description")
     reference: str | None = Field(default=None, description="External reference")
     transaction_id: str | None = Field(default=None, description="Associated transaction ID")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     completed_at: datetime | None = Field(default=None, description="Completion timestamp")
-    metadata: dict = Field(default_factory=dict, description="Additional metadata")
+    metadata: Mapping[str, Any] = Field(default=EMPTY_MAPPING, description="Additional metadata")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _amount_to_minor_units(cls, data: Any) -> Any:
+        """Accept a decimal ``amount`` and store it as integer minor units"""
+        return amount_to_minor_units(data, cls.model_fields)
+
+    @computed_field
+    @property
+    def amount(self) -> Decimal:
+        """Payment amount in major currency units"""
+        return Decimal(self.amount_minor).scaleb(-self.currency_exponent)
 
     def is_completed(self) -> bool:
         """Check if payment is completed"""
-        return self.status == PaymentStatus.COMPLETED
+        return self.status == _COMPLETED
 
     def is_pending(self) -> bool:
         """Check if payment is pending"""
-        return self.status in [PaymentStatus.PENDING, PaymentStatus.PROCESSING]
+        return self.status in _PENDING_STATUSES
 
     def can_cancel(self) -> bool:
         """Check if payment can be cancelled"""
-        return self.status in [PaymentStatus.PENDING, PaymentStatus.PROCESSING]
+        return self.status in _PENDING_STATUSES
+
+
+@cache
+def _payment_list_adapter() -> TypeAdapter[list[Payment]]:
+    """Validator for payment batches, built once on first use"""
+    return TypeAdapter(list[Payment])
+
+
+def parse_payments(raw: str | bytes) -> list[Payment]:
+    """Validate a JSON array of payments in a single pydantic-core call"""
+    return _payment_list_adapter().validate_json(raw)
+
+
+def validate_payments(records: list[dict]) -> list[Payment]:
+    """Validate a batch of payment records in a single pydantic-core call"""
+    return _payment_list_adapter().validate_python(records)
 
 
 class MobileMoneyDestination(BaseModel):
     """Mobile money destination details"""
 
-    phone_number: str = Field(..., description="Phone number in E.164 format")
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    phone_number: PhoneNumber = Field(..., description="Phone number in E.164 format")
     provider: MobileMoneyProvider = Field(..., description="Mobile money provider")
-    country_code: str = Field(..., description="ISO 3166-1 alpha-2 country code")
+    country_code: CountryCode = Field(..., description="ISO 3166-1 alpha-2 country code")
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "MobileMoneyDestination":
+        """Copy the destination, dropping the cached string that the update may invalidate"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("_destination_string", None)
+        return copied
+
+    @cached_property
+    def _destination_string(self) -> str:
+        return f"{self.provider.value}:{self.country_code}:{self.phone_number}"
 
     def to_destination_string(self) -> str:
         """Convert to destination string format: provider:country:phone"""
-        return f"{self.provider.value}:{self.country_code}:{self.phone_number}"
+        return self._destination_string
 
     @classmethod
     def from_destination_string(cls, destination: str) -> "MobileMoneyDestination":
         """Parse destination string back to MobileMoneyDestination"""
-        parts = destination.split(":")
-        if len(parts) != 3:
+        provider_value, sep, rest = destination.partition(":")
+        country_code, sep2, phone_number = rest.partition(":")
+        provider = _PROVIDER_BY_VALUE.get(provider_value)
+        if not sep or not sep2 or ":" in phone_number or provider is None:
             raise ValueError(f"Invalid mobile money destination format: {destination}")
         return cls(
-            provider=parts[0],
-            country_code=parts[1],
-            phone_number=parts[2],
+            provider=provider,
+            country_code=country_code,
+            phone_number=phone_number,
         )
@@ -5,12 +5,16 @@ SAR: Suspicious Activity Report
 CTR: Currency Transaction Report (for transactions >= $10,000)
 """
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
-from typing import Any
+from functools import cache
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from ._types import EMPTY_MAPPING, InternedStr, utcnow
 
 
 class ReportType(str, Enum):
@@ -71,6 +75,8 @@ class SuspiciousActivityType(str, Enum):
 class FinancialInstitution(BaseModel):
     """Financial institution information for regulatory reports"""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     name: str = Field(..., description="Institution legal name")
     ein: str | None = Field(None, description="Employer Identification Number")
     tin: str | None = Field(None, description="Tax Identification Number")
@@ -79,9 +85,9 @@ class FinancialInstitution(BaseModel):
     # Address
     address_street: str = Field(..., description="Street address")
     address_city: str = Field(..., description="City")
-    address_state: str | None = Field(None, description="State/Province")
+    address_state: InternedStr | None = Field(None, description="State/Province")
     address_postal_code: str = Field(..., description="Postal code")
-    address_country: str = Field(..., description="Country code (ISO 3166-1 alpha-2)")
+    address_country: InternedStr = Field(..., description="Country code (ISO 3166-1 alpha-2)")
 
     # Contact
     phone: str = Field(..., description="Primary phone number")
@@ -96,24 +102,14 @@ class FinancialInstitution(BaseModel):
     )
 
 
-class SubjectInformation(BaseModel):
-    """Subject (person or entity) information for reports"""
+class _SubjectBase(BaseModel):
+    """Fields shared by every kind of report subject"""
 
-    # Identity
-    entity_type: str = Field(..., description="Type: individual, entity, unknown")
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
-    # Individual information
-    first_name: str | None = Field(None, description="First name")
-    middle_name: str | None = Field(None, description="Middle name")
-    last_name: str | None = Field(None, description="Last name")
-    date_of_birth: datetime | None = Field(None, description="Date of birth")
-    ssn: str | None = Field(None, description="Social Security Number")
+    # Tax identifier (entities, and individuals operating as sole proprietors)
     ein: str | None = Field(None, description="Employer Identification Number")
 
-    # Entity information
-    entity_name: str | None = Field(None, description="Legal entity name")
-    dba_name: str | None = Field(None, description="Doing Business As name")
-
     # Contact
     phone: str | None = Field(None, description="Phone number")
     email: str | None = Field(None, description="Email address")
@@ -121,21 +117,19 @@ class SubjectInformation(BaseModel):
     # Address
     address_street: str | None = Field(None, description="Street address")
     address_city: str | None = Field(None, description="City")
-    address_state: str | None = Field(None, description="State/Province")
+    address_state: InternedStr | None = Field(None, description="State/Province")
     address_postal_code: str | None = Field(None, description="Postal code")
-    address_country: str | None = Field(None, description="Country code")
+    address_country: InternedStr | None = Field(None, description="Country code")
 
     # Identification documents
     identification_type: str | None = Field(
         None, description="ID type: passport, drivers_license, national_id"
     )
     identification_number: str | None = Field(None, description="ID number")
-    identification_country: str | None = Field(None, description="Issuing country")
+    identification_country: InternedStr | None = Field(None, description="Issuing country")
 
     # Account information
-    account_numbers: list[str] = Field(
-        default_factory=list, description="Associated account numbers"
-    )
+    account_numbers: tuple[str, ...] = Field(default=(), description="Associated account numbers")
 
     # Relationship to institution
     relationship: str | None = Field(
@@ -144,24 +138,67 @@ class SubjectInformation(BaseModel):
 
     # Occupation/Business
     occupation: str | None = Field(None, description="Occupation or business type")
-    employer: str | None = Field(None, description="Employer name")
 
     # Risk indicators
     is_politically_exposed: bool = Field(default=False, description="Whether subject is a PEP")
 
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    metadata: Mapping[str, Any] = Field(default=EMPTY_MAPPING, description="Additional metadata")
+
+
+class IndividualSubject(_SubjectBase):
+    """Individual (natural person) subject"""
+
+    entity_type: Literal["individual"] = Field("individual", description="Subject type")
+
+    first_name: str | None = Field(None, description="First name")
+    middle_name: str | None = Field(None, description="Middle name")
+    last_name: str | None = Field(None, description="Last name")
+    date_of_birth: datetime | None = Field(None, description="Date of birth")
+    ssn: str | None = Field(None, description="Social Security Number")
+    employer: str | None = Field(None, description="Employer name")
+
+
+class EntitySubject(_SubjectBase):
+    """Legal entity subject"""
+
+    entity_type: Literal["entity"] = Field("entity", description="Subject type")
+
+    entity_name: str | None = Field(None, description="Legal entity name")
+    dba_name: str | None = Field(None, description="Doing Business As name")
+
+
+class UnknownSubject(_SubjectBase):
+    """Subject whose type could not be established; keeps whatever names are known"""
+
+    entity_type: Literal["unknown"] = Field("unknown", description="Subject type")
+
+    first_name: str | None = Field(None, description="First name")
+    middle_name: str | None = Field(None, description="Middle name")
+    last_name: str | None = Field(None, description="Last name")
+    entity_name: str | None = Field(None, description="Legal entity name")
+
+
+# Subject (person or entity) information for reports, dispatched on entity_type
+SubjectInformation = Annotated[
+    IndividualSubject | EntitySubject | UnknownSubject, Field(discriminator="entity_type")
+]
+
+# Cent quantum for rounding report amounts before integer aggregation
+_CENT = Decimal("0.01")
 
 
 class TransactionDetails(BaseModel):
     """Transaction details for regulatory reports"""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     transaction_id: str = Field(..., description="Transaction ID")
     transaction_date: datetime = Field(..., description="Transaction date")
     transaction_type: str = Field(..., description="Transaction type")
 
     # Amounts
     amount: Decimal = Field(..., description="Transaction amount")
-    currency: str = Field(default="USD", description="Currency code")
+    currency: InternedStr = Field(default="USD", description="Currency code")
 
     # Accounts involved
     from_account_number: str | None = Field(None, description="Source account")
@@ -182,11 +219,100 @@ class TransactionDetails(BaseModel):
     reference_number: str | None = Field(None, description="Reference number")
 
     # Related transactions
-    related_transaction_ids: list[str] = Field(
-        default_factory=list, description="Related transaction IDs"
+    related_transaction_ids: tuple[str, ...] = Field(
+        default=(), description="Related transaction IDs"
     )
 
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    metadata: Mapping[str, Any] = Field(default=EMPTY_MAPPING, description="Additional metadata")
+
+    @property
+    def amount_cents(self) -> int:
+        """Amount in integer cents (half-up), for aggregation without Decimal arithmetic"""
+        return int(self.amount.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+class TransactionBatch(BaseModel):
+    """
+    Column-oriented view of report transactions for window aggregation
+
+    Holds one tuple per attribute, ordered by transaction time, so window
+    sums walk flat int sequences instead of TransactionDetails objects.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    transaction_ids: tuple[str, ...] = Field(default=(), description="Transaction IDs")
+    timestamps: tuple[int, ...] = Field(default=(), description="Unix timestamps (seconds)")
+    amounts_cents: tuple[int, ...] = Field(default=(), description="Amounts in integer cents")
+
+    @classmethod
+    def from_details(cls, transactions: Iterable[TransactionDetails]) -> "TransactionBatch":
+        """Build a time-ordered batch from transaction details"""
+        rows = sorted(
+            (int(txn.transaction_date.timestamp()), txn.amount_cents, txn.transaction_id)
+            for txn in transactions
+        )
+        if not rows:
+            return cls()
+        timestamps, amounts_cents, transaction_ids = zip(*rows, strict=True)
+        return cls.model_construct(
+            transaction_ids=transaction_ids, timestamps=timestamps, amounts_cents=amounts_cents
+        )
+
+    def window_totals(self, window_seconds: int) -> list[int]:
+        """
+        Trailing window sum at each transaction
+
+        Each total covers the transactions in (timestamp - window_seconds, timestamp],
+        computed in a single two-pointer pass.
+        """
+        timestamps = self.timestamps
+        amounts = self.amounts_cents
+        totals = []
+        running = 0
+        start = 0
+        for end, timestamp in enumerate(timestamps):
+            running += amounts[end]
+            while start <= end and timestamps[start] <= timestamp - window_seconds:
+                running -= amounts[start]
+                start += 1
+            totals.append(running)
+        return totals
+
+    def ctr_breaches(self, window_seconds: int, threshold_cents: int) -> list[str]:
+        """IDs of transactions at which the trailing window total reaches the CTR threshold"""
+        return [
+            transaction_id
+            for transaction_id, total in zip(
+                self.transaction_ids, self.window_totals(window_seconds), strict=True
+            )
+            if total >= threshold_cents
+        ]
+
+    def structuring_breaches(self, window_seconds: int, threshold_cents: int) -> list[str]:
+        """
+        IDs of transactions completing a window that reaches the threshold
+        while every transaction in it is individually below the threshold
+
+        That is the structuring pattern: splitting a reportable amount into
+        smaller transactions. Same single two-pointer pass as window_totals.
+        """
+        timestamps = self.timestamps
+        amounts = self.amounts_cents
+        breaches = []
+        running = 0
+        large = 0  # Transactions in the window at or above the threshold on their own
+        start = 0
+        for end, timestamp in enumerate(timestamps):
+            running += amounts[end]
+            large += amounts[end] >= threshold_cents
+            while start <= end and timestamps[start] <= timestamp - window_seconds:
+                running -= amounts[start]
+                large -= amounts[start] >= threshold_cents
+                start += 1
+            if running >= threshold_cents and not large:
+                breaches.append(self.transaction_ids[end])
+        return breaches
 
 
 class SuspiciousActivityReport(BaseModel):
@@ -199,6 +325,8 @@ class SuspiciousActivityReport(BaseModel):
     US: FinCEN Form 111
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Report ID")
     organization_id: str = Field(..., description="Organization ID")
     report_type: ReportType = Field(default=ReportType.SAR, description="Report type")
@@ -232,7 +360,7 @@ class SuspiciousActivityReport(BaseModel):
 
     # Total amounts
     total_amount: Decimal = Field(..., description="Total amount involved")
-    total_currency: str = Field(default="USD", description="Currency")
+    total_currency: InternedStr = Field(default="USD", description="Currency")
 
     # Narrative
     narrative_summary: str = Field(
@@ -240,9 +368,9 @@ class SuspiciousActivityReport(BaseModel):
     )
 
     # Supporting information
-    ip_addresses: list[str] = Field(default_factory=list, description="IP addresses involved")
-    email_addresses: list[str] = Field(default_factory=list, description="Email addresses involved")
-    phone_numbers: list[str] = Field(default_factory=list, description="Phone numbers involved")
+    ip_addresses: tuple[str, ...] = Field(default=(), description="IP addresses involved")
+    email_addresses: tuple[str, ...] = Field(default=(), description="Email addresses involved")
+    phone_numbers: tuple[str, ...] = Field(default=(), description="Phone numbers involved")
 
     # Law enforcement
     law_enforcement_contacted: bool = Field(
@@ -254,10 +382,10 @@ class SuspiciousActivityReport(BaseModel):
     )
 
     # Internal tracking
-    compliance_check_ids: list[str] = Field(
-        default_factory=list, description="Related compliance check IDs"
+    compliance_check_ids: tuple[str, ...] = Field(
+        default=(), description="Related compliance check IDs"
     )
-    alert_ids: list[str] = Field(default_factory=list, description="Related alert IDs")
+    alert_ids: tuple[str, ...] = Field(default=(), description="Related alert IDs")
 
     # Filing information
     prepared_by: str = Field(..., description="User ID who prepared report")
@@ -266,9 +394,7 @@ class SuspiciousActivityReport(BaseModel):
     filed_by: str | None = Field(None, description="User ID who filed")
 
     # Timestamps
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When report was created"
-    )
+    created_at: datetime = Field(default_factory=utcnow, description="When report was created")
     reviewed_at: datetime | None = Field(None, description="Review timestamp")
     approved_at: datetime | None = Field(None, description="Approval timestamp")
     filed_at: datetime | None = Field(None, description="Filing timestamp")
@@ -283,9 +409,7 @@ class SuspiciousActivityReport(BaseModel):
     prior_bsa_identifier: str | None = Field(None, description="Prior BSA identifier")
 
     # Attachments
-    attachment_urls: list[str] = Field(
-        default_factory=list, description="URLs to supporting documents"
-    )
+    attachment_urls: tuple[str, ...] = Field(default=(), description="URLs to supporting documents")
 
     # Metadata
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
@@ -300,6 +424,8 @@ class CurrencyTransactionReport(BaseModel):
     US: FinCEN Form 112
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Report ID")
     organization_id: str = Field(..., description="Organization ID")
     report_type: ReportType = Field(default=ReportType.CTR, description="Report type")
@@ -330,7 +456,7 @@ class CurrencyTransactionReport(BaseModel):
     total_cash_in: Decimal = Field(default=Decimal("0"), description="Total cash received")
     total_cash_out: Decimal = Field(default=Decimal("0"), description="Total cash paid out")
     total_amount: Decimal = Field(..., description="Total amount (in + out)")
-    currency: str = Field(default="USD", description="Currency")
+    currency: InternedStr = Field(default="USD", description="Currency")
 
     # Transaction type
     transaction_type: str = Field(
@@ -355,15 +481,15 @@ class CurrencyTransactionReport(BaseModel):
     atm_location: str | None = Field(None, description="ATM location")
 
     # Account information
-    account_numbers: list[str] = Field(default_factory=list, description="Account numbers involved")
+    account_numbers: tuple[str, ...] = Field(default=(), description="Account numbers involved")
 
     # Verification
     identification_verified: bool = Field(default=False, description="Identification was verified")
     verification_method: str | None = Field(None, description="Method of verification")
 
     # Internal tracking
-    compliance_check_ids: list[str] = Field(
-        default_factory=list, description="Related compliance check IDs"
+    compliance_check_ids: tuple[str, ...] = Field(
+        default=(), description="Related compliance check IDs"
     )
 
     # Filing information
@@ -372,9 +498,7 @@ class CurrencyTransactionReport(BaseModel):
     filed_by: str | None = Field(None, description="User ID who filed")
 
     # Timestamps
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When report was created"
-    )
+    created_at: datetime = Field(default_factory=utcnow, description="When report was created")
     reviewed_at: datetime | None = Field(None, description="Review timestamp")
     filed_at: datetime | None = Field(None, description="Filing timestamp")
 
@@ -398,6 +522,8 @@ class CurrencyTransactionReport(BaseModel):
 class RegulatoryReportSummary(BaseModel):
     """Summary view of regulatory report for listing"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Report ID")
     organization_id: str = Field(..., description="Organization ID")
     report_type: ReportType = Field(..., description="Report type")
@@ -406,7 +532,7 @@ class RegulatoryReportSummary(BaseModel):
 
     # Key amounts
     total_amount: Decimal = Field(..., description="Total amount")
-    currency: str = Field(..., description="Currency")
+    currency: InternedStr = Field(..., description="Currency")
 
     # Key dates
     transaction_date: datetime | None = Field(None, description="Transaction date")
@@ -430,6 +556,8 @@ class RegulatoryReportSummary(BaseModel):
 class RegulatoryReportingConfig(BaseModel):
     """Configuration for automated regulatory reporting"""
 
+    model_config = ConfigDict(frozen=True)
+
     organization_id: str = Field(..., description="Organization ID")
 
     # CTR configuration
@@ -439,7 +567,7 @@ class RegulatoryReportingConfig(BaseModel):
     )
     ctr_auto_generate: bool = Field(default=True, description="Automatically generate CTRs")
     ctr_aggregation_window_hours: int = Field(
-        default=24, description="Hours to aggregate transactions"
+        default=24, ge=1, description="Hours to aggregate transactions"
     )
 
     # SAR configuration
@@ -463,10 +591,10 @@ class RegulatoryReportingConfig(BaseModel):
     notify_on_report_generation: bool = Field(
         default=True, description="Notify on report generation"
     )
-    notification_emails: list[str] = Field(
-        default_factory=list, description="Email addresses for notifications"
+    notification_emails: tuple[str, ...] = Field(
+        default=(), description="Email addresses for notifications"
     )
-    notification_user_ids: list[str] = Field(default_factory=list, description="User IDs to notify")
+    notification_user_ids: tuple[str, ...] = Field(default=(), description="User IDs to notify")
 
     # Retention
     report_retention_days: int = Field(
@@ -480,4 +608,27 @@ class RegulatoryReportingConfig(BaseModel):
     fincen_filing_type: str | None = Field(None, description="FinCEN filing type identifier")
 
     # Metadata
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional configuration")
+    metadata: Mapping[str, Any] = Field(
+        default=EMPTY_MAPPING, description="Additional configuration"
+    )
+
+    @property
+    def ctr_threshold_cents(self) -> int:
+        """CTR threshold in integer cents"""
+        return int(self.ctr_threshold.scaleb(2))
+
+
+def dump_report(report: SuspiciousActivityReport | CurrencyTransactionReport) -> bytes:
+    """Serialize a report straight to JSON bytes with the compiled pydantic-core serializer"""
+    return report.__pydantic_serializer__.to_json(report)
+
+
+@cache
+def _summary_list_adapter() -> TypeAdapter[list[RegulatoryReportSummary]]:
+    """Serializer for report listings, built once on first use"""
+    return TypeAdapter(list[RegulatoryReportSummary])
+
+
+def dump_report_summaries(summaries: list[RegulatoryReportSummary]) -> bytes:
+    """Serialize a page of report summaries to JSON bytes in a single pydantic-core call"""
+    return _summary_list_adapter().dump_json(summaries)
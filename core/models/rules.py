@@ -2,12 +2,19 @@
 Rule engine models for configurable compliance rules
 """
 
+import operator
+import re
+from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._types import InternedStr, utcnow
 
 
 class RuleType(str, Enum):
@@ -45,6 +52,13 @@ class RuleConditionOperator(str, Enum):
     BETWEEN = "between"
 
 
+class ConditionsLogic(str, Enum):
+    """How a rule combines its conditions"""
+
+    AND = "AND"
+    OR = "OR"
+
+
 class RuleAction(str, Enum):
     """Action to take when rule is triggered"""
 
@@ -76,10 +90,106 @@ class RuleScope(str, Enum):
     ACCOUNT = "account"  # Specific account
 
 
+def _members(value: Any) -> frozenset | list:
+    """IN/NOT_IN compare value as a hashed set; a scalar acts as a one-element set"""
+    items = value if isinstance(value, list) else [value]
+    try:
+        return frozenset(items)
+    except TypeError:
+        # Unhashable members (e.g. nested lists) fall back to a linear scan
+        return items
+
+
+def _in(field_value: Any, members: frozenset | list) -> bool:
+    """Membership test against a precomputed _members() collection"""
+    return field_value in members
+
+
+def _not_in(field_value: Any, members: frozenset | list) -> bool:
+    """Negated membership test"""
+    return field_value not in members
+
+
+def _contains(field_value: Any, compare_value: Any) -> bool:
+    """Substring test against the stringified field"""
+    return compare_value in str(field_value)
+
+
+def _not_contains(field_value: Any, compare_value: Any) -> bool:
+    """Negated substring test"""
+    return compare_value not in str(field_value)
+
+
+def _matches_regex(field_value: Any, pattern: re.Pattern[str]) -> bool:
+    """Anchored regex match against the field, stringified only when it isn't already"""
+    if not isinstance(field_value, str):
+        field_value = str(field_value)
+    return pattern.match(field_value) is not None
+
+
+def _between(field_value: Any, compare_value: Any) -> bool:
+    """Inclusive range test against a [low, high] pair"""
+    if isinstance(compare_value, list) and len(compare_value) == 2:
+        return compare_value[0] <= field_value <= compare_value[1]
+    return False
+
+
+# Operator -> comparison, resolved with one lookup instead of an if/elif ladder
+_OPERATORS: dict[RuleConditionOperator, Callable[[Any, Any], bool]] = {
+    RuleConditionOperator.EQUALS: operator.eq,
+    RuleConditionOperator.NOT_EQUALS: operator.ne,
+    RuleConditionOperator.GREATER_THAN: operator.gt,
+    RuleConditionOperator.GREATER_THAN_OR_EQUAL: operator.ge,
+    RuleConditionOperator.LESS_THAN: operator.lt,
+    RuleConditionOperator.LESS_THAN_OR_EQUAL: operator.le,
+    RuleConditionOperator.IN: _in,
+    RuleConditionOperator.NOT_IN: _not_in,
+    RuleConditionOperator.CONTAINS: _contains,
+    RuleConditionOperator.NOT_CONTAINS: _not_contains,
+    RuleConditionOperator.MATCHES_REGEX: _matches_regex,
+    RuleConditionOperator.BETWEEN: _between,
+}
+
+
+# Relative evaluation cost; cheap checks run first so AND fails fast and OR succeeds fast
+_OPERATOR_COST: dict[RuleConditionOperator, int] = {
+    RuleConditionOperator.EQUALS: 0,
+    RuleConditionOperator.NOT_EQUALS: 0,
+    RuleConditionOperator.GREATER_THAN: 1,
+    RuleConditionOperator.GREATER_THAN_OR_EQUAL: 1,
+    RuleConditionOperator.LESS_THAN: 1,
+    RuleConditionOperator.LESS_THAN_OR_EQUAL: 1,
+    RuleConditionOperator.IN: 1,
+    RuleConditionOperator.NOT_IN: 1,
+    RuleConditionOperator.BETWEEN: 2,
+    RuleConditionOperator.CONTAINS: 3,
+    RuleConditionOperator.NOT_CONTAINS: 3,
+    RuleConditionOperator.MATCHES_REGEX: 5,
+}
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Exact Decimal for a number; floats go through str() to keep their written value"""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _coerce_number(value: Any) -> Any:
+    """Coerce a numeric compare value (or each bound of a list) to Decimal"""
+    if isinstance(value, list):
+        return [_to_decimal(item) for item in value]
+    return _to_decimal(value)
+
+
+# Signature of a compiled condition or rule: context in, match flag out
+Matcher = Callable[[Mapping[str, Any]], bool]
+
+
 class RuleCondition(BaseModel):
     """Condition for rule evaluation"""
 
-    field: str = Field(..., description="Field to evaluate (e.g., 'amount', 'country')")
+    model_config = ConfigDict(frozen=True)
+
+    field: InternedStr = Field(..., description="Field to evaluate (e.g., 'amount', 'country')")
     operator: RuleConditionOperator = Field(..., description="Comparison operator")
     value: Any = Field(..., description="Value to compare against")
     value_type: str = Field(default="string", description="Type: string, number, boolean, list")
@@ -94,62 +204,83 @@ class RuleCondition(BaseModel):
         Returns:
             True if condition matches
         """
-        # Get field value from context
-        field_value = context.get(self.field)
-        if field_value is None:
-            return False
+        return self._matcher(context)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "RuleCondition":
+        """Copy the condition, dropping the cached matcher that the update may invalidate"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("_matcher", None)
+        return copied
+
+    @cached_property
+    def _matcher(self) -> Matcher:
+        """Compiled once so the compare value is coerced once, not per evaluation"""
+        return self.compile()
+
+    def compile(self) -> Matcher:
+        """Build a matcher with the operator and coerced compare value resolved up front"""
+        field = self.field
+        compare = _OPERATORS[self.operator]
 
-        # Convert types for comparison
         compare_value = self.value
         if self.value_type == "number":
-            field_value = (
-                float(field_value) if isinstance(field_value, int | float | Decimal) else 0
-            )
-            compare_value = float(self.value)
+            compare_value = _coerce_number(compare_value)
         elif self.value_type == "boolean":
-            field_value = bool(field_value)
-            compare_value = bool(self.value)
-
-        # Evaluate operator
-        if self.operator == RuleConditionOperator.EQUALS:
-            return field_value == compare_value
-        elif self.operator == RuleConditionOperator.NOT_EQUALS:
-            return field_value != compare_value
-        elif self.operator == RuleConditionOperator.GREATER_THAN:
-            return field_value > compare_value
-        elif self.operator == RuleConditionOperator.GREATER_THAN_OR_EQUAL:
-            return field_value >= compare_value
-        elif self.operator == RuleConditionOperator.LESS_THAN:
-            return field_value < compare_value
-        elif self.operator == RuleConditionOperator.LESS_THAN_OR_EQUAL:
-            return field_value <= compare_value
-        elif self.operator == RuleConditionOperator.IN:
-            return field_value in (
-                compare_value if isinstance(compare_value, list) else [compare_value]
-            )
-        elif self.operator == RuleConditionOperator.NOT_IN:
-            return field_value not in (
-                compare_value if isinstance(compare_value, list) else [compare_value]
-            )
-        elif self.operator == RuleConditionOperator.CONTAINS:
-            return compare_value in str(field_value)
-        elif self.operator == RuleConditionOperator.NOT_CONTAINS:
-            return compare_value not in str(field_value)
+            compare_value = bool(compare_value)
+        if self.operator in (RuleConditionOperator.IN, RuleConditionOperator.NOT_IN):
+            compare_value = _members(compare_value)
         elif self.operator == RuleConditionOperator.MATCHES_REGEX:
-            import re
+            # Compiled once here and bound into the cached matcher
+            compare_value = re.compile(compare_value)
 
-            return bool(re.match(compare_value, str(field_value)))
-        elif self.operator == RuleConditionOperator.BETWEEN:
-            if isinstance(compare_value, list) and len(compare_value) == 2:
-                return compare_value[0] <= field_value <= compare_value[1]
-            return False
+        if self.value_type == "number":
 
-        return False
+            def matcher(context: Mapping[str, Any]) -> bool:
+                field_value = context.get(field)
+                if field_value is None:
+                    return False
+                # Decimal and int compare exactly against Decimal; only floats need converting
+                if isinstance(field_value, float):
+                    return compare(_to_decimal(field_value), compare_value)
+                if not isinstance(field_value, int | Decimal):
+                    return compare(0, compare_value)
+                return compare(field_value, compare_value)
+
+        elif self.value_type == "boolean":
+
+            def matcher(context: Mapping[str, Any]) -> bool:
+                field_value = context.get(field)
+                return field_value is not None and compare(bool(field_value), compare_value)
+
+        else:
+
+            def matcher(context: Mapping[str, Any]) -> bool:
+                field_value = context.get(field)
+                return field_value is not None and compare(field_value, compare_value)
+
+        return matcher
+
+
+# Reducer applied to the per-condition results for each combining logic
+_REDUCERS: dict[ConditionsLogic, Callable[[Any], bool]] = {
+    ConditionsLogic.AND: all,
+    ConditionsLogic.OR: any,
+}
+
+
+def _never(context: Mapping[str, Any]) -> bool:
+    """Matcher for rules that can never trigger"""
+    return False
 
 
 class ComplianceRule(BaseModel):
     """Configurable compliance rule"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique rule ID")
     organization_id: str | None = Field(None, description="Organization ID (None for global rules)")
 
@@ -166,11 +297,9 @@ class ComplianceRule(BaseModel):
     )
 
     # Conditions
-    conditions: list[RuleCondition] = Field(
-        default_factory=list, description="Conditions to evaluate"
-    )
-    conditions_logic: str = Field(
-        default="AND", description="Logic for combining conditions: AND, OR"
+    conditions: tuple[RuleCondition, ...] = Field(default=(), description="Conditions to evaluate")
+    conditions_logic: ConditionsLogic = Field(
+        default=ConditionsLogic.AND, description="Logic for combining conditions: AND, OR"
     )
 
     # Action
@@ -192,7 +321,7 @@ class ComplianceRule(BaseModel):
 
     # Timestamps
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When rule was created"
+        default_factory=utcnow, description="When rule was created"
     )
     updated_at: datetime | None = Field(None, description="When rule was last updated")
     created_by: str | None = Field(None, description="User who created rule")
@@ -209,20 +338,43 @@ class ComplianceRule(BaseModel):
         """
         if not self.enabled:
             return False
+        return self._matcher(context)
 
-        if not self.conditions:
-            return False
+    def evaluate_batch(self, contexts: Iterable[Mapping[str, Any]]) -> list[bool]:
+        """
+        Evaluate rule against many contexts, e.g. for batch screening
 
-        # Evaluate all conditions
-        results = [condition.evaluate(context) for condition in self.conditions]
+        Args:
+            contexts: Evaluation contexts, one per transaction
 
-        # Apply logic
-        if self.conditions_logic == "AND":
-            return all(results)
-        elif self.conditions_logic == "OR":
-            return any(results)
+        Returns:
+            Trigger flag per context, in input order
+        """
+        if not self.enabled:
+            return [False for _ in contexts]
+        matcher = self._matcher
+        return [matcher(context) for context in contexts]
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "ComplianceRule":
+        """Copy the rule, dropping the cached matcher that the update may invalidate"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("_matcher", None)
+        return copied
+
+    @cached_property
+    def _matcher(self) -> Matcher:
+        """Conditions compiled once into a single short-circuiting matcher"""
+        if not self.conditions:
+            return _never
 
-        return False
+        # AND/OR are order-independent, so evaluate the cheapest conditions first
+        ordered = sorted(self.conditions, key=lambda condition: _OPERATOR_COST[condition.operator])
+        matchers = tuple(condition._matcher for condition in ordered)
+        reduce = _REDUCERS[self.conditions_logic]
+        return lambda context: reduce(matcher(context) for matcher in matchers)
 
     def should_apply_to(self, target_id: str | None = None) -> bool:
         """
@@ -263,7 +415,7 @@ class RuleEvaluationResult(BaseModel):
     message: str | None = Field(None, description="Message")
     risk_score_impact: int = Field(default=0, description="Risk score impact")
     context: dict[str, Any] = Field(default_factory=dict, description="Evaluation context")
-    evaluated_at: datetime = Field(default_factory=datetime.utcnow, description="When evaluated")
+    evaluated_at: datetime = Field(default_factory=utcnow, description="When evaluated")
 
 
 class RuleSet(BaseModel):
@@ -287,16 +439,68 @@ class RuleSet(BaseModel):
     )
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="When created")
+    created_at: datetime = Field(default_factory=utcnow, description="When created")
     updated_at: datetime | None = Field(None, description="When updated")
 
     # Metadata
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    def compile(self, rules_by_id: Mapping[str, ComplianceRule]) -> tuple[ComplianceRule, ...]:
+        """
+        Resolve this set's enabled rules in evaluation order
+
+        Rules are sorted by priority once here (ties keep rule_ids order) so callers can
+        cache the tuple and evaluate it per transaction without re-sorting.
+
+        Args:
+            rules_by_id: Known rules keyed by ID; unknown IDs are skipped
+
+        Returns:
+            Rules in the order they should be evaluated
+        """
+        rules = [
+            rules_by_id[rule_id]
+            for rule_id in self.rule_ids
+            if rule_id in rules_by_id and rules_by_id[rule_id].enabled
+        ]
+        if self.evaluation_order == "priority":
+            rules.sort(key=lambda rule: rule.priority)
+        return tuple(rules)
+
+    def evaluate(
+        self,
+        compiled: tuple[ComplianceRule, ...],
+        context: dict[str, Any],
+        target_id: str | None = None,
+    ) -> list[ComplianceRule]:
+        """
+        Evaluate compiled rules against context
+
+        Args:
+            compiled: Rules from compile()
+            context: Evaluation context
+            target_id: Customer/account/transaction ID used for rule scoping
+
+        Returns:
+            Triggered rules, in evaluation order
+        """
+        if not self.enabled:
+            return []
+
+        triggered = []
+        for rule in compiled:
+            if rule.should_apply_to(target_id) and rule.evaluate(context):
+                triggered.append(rule)
+                if self.stop_on_first_trigger:
+                    break
+        return triggered
+
 
 class RuleTemplate(BaseModel):
     """Pre-configured rule template"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Template ID")
     name: str = Field(..., description="Template name")
     description: str = Field(..., description="Template description")
@@ -304,7 +508,9 @@ class RuleTemplate(BaseModel):
     category: str = Field(..., description="Category: kyc, aml, sanctions, velocity, etc.")
 
     # Template configuration
-    default_conditions: list[dict] = Field(default_factory=list, description="Default conditions")
+    default_conditions: tuple[RuleCondition, ...] = Field(
+        default=(), description="Default conditions"
+    )
     default_action: RuleAction = Field(..., description="Default action")
     default_severity: RuleSeverity = Field(..., description="Default severity")
 
@@ -321,82 +527,84 @@ class RuleTemplate(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
-# Pre-built rule templates
-RULE_TEMPLATES = {
-    "high_value_transaction": RuleTemplate(
-        id="tmpl_high_value",
-        name="High Value Transaction",
-        description="Flag transactions above a certain amount for review",
-        rule_type=RuleType.AMOUNT_THRESHOLD,
-        category="aml",
-        default_conditions=[
-            {
-                "field": "amount",
-                "operator": "greater_than",
-                "value": 10000,
-                "value_type": "number",
-            }
-        ],
-        default_action=RuleAction.REVIEW,
-        default_severity=RuleSeverity.HIGH,
-        configurable_fields=["amount", "action"],
-        tags=["aml", "threshold"],
-    ),
-    "blocked_country": RuleTemplate(
-        id="tmpl_blocked_country",
-        name="Blocked Country",
-        description="Block transactions to/from specific countries",
-        rule_type=RuleType.GEO_FENCING,
-        category="sanctions",
-        default_conditions=[
-            {
-                "field": "country_code",
-                "operator": "in",
-                "value": ["IR", "KP", "SY"],  # Iran, North Korea, Syria
-                "value_type": "list",
-            }
-        ],
-        default_action=RuleAction.BLOCK,
-        default_severity=RuleSeverity.CRITICAL,
-        configurable_fields=["countries"],
-        tags=["sanctions", "geo"],
-    ),
-    "daily_velocity": RuleTemplate(
-        id="tmpl_daily_velocity",
-        name="Daily Transaction Limit",
-        description="Limit daily transaction count or amount per customer",
-        rule_type=RuleType.VELOCITY,
-        category="fraud",
-        default_conditions=[
-            {
-                "field": "daily_count",
-                "operator": "greater_than",
-                "value": 10,
-                "value_type": "number",
-            }
-        ],
-        default_action=RuleAction.BLOCK,
-        default_severity=RuleSeverity.MEDIUM,
-        configurable_fields=["daily_count", "daily_amount"],
-        tags=["velocity", "fraud"],
-    ),
-    "unverified_kyc": RuleTemplate(
-        id="tmpl_unverified_kyc",
-        name="Unverified KYC",
-        description="Block transactions for customers without verified KYC",
-        rule_type=RuleType.KYC_VERIFICATION,
-        category="kyc",
-        default_conditions=[
-            {
-                "field": "kyc_status",
-                "operator": "not_equals",
-                "value": "verified",
-                "value_type": "string",
-            }
-        ],
-        default_action=RuleAction.BLOCK,
-        default_severity=RuleSeverity.HIGH,
-        configurable_fields=["action"],
-        tags=["kyc"],
-    ),
-}
+# Pre-built rule templates; conditions are validated once here and shared read-only
+RULE_TEMPLATES: Mapping[str, RuleTemplate] = MappingProxyType(
+    {
+        "high_value_transaction": RuleTemplate(
+            id="tmpl_high_value",
+            name="High Value Transaction",
+            description="Flag transactions above a certain amount for review",
+            rule_type=RuleType.AMOUNT_THRESHOLD,
+            category="aml",
+            default_conditions=[
+                {
+                    "field": "amount",
+                    "operator": "greater_than",
+                    "value": 10000,
+                    "value_type": "number",
+                }
+            ],
+            default_action=RuleAction.REVIEW,
+            default_severity=RuleSeverity.HIGH,
+            configurable_fields=["amount", "action"],
+            tags=["aml", "threshold"],
+        ),
+        "blocked_country": RuleTemplate(
+            id="tmpl_blocked_country",
+            name="Blocked Country",
+            description="Block transactions to/from specific countries",
+            rule_type=RuleType.GEO_FENCING,
+            category="sanctions",
+            default_conditions=[
+                {
+                    "field": "country_code",
+                    "operator": "in",
+                    "value": ["IR", "KP", "SY"],  # Iran, North Korea, Syria
+                    "value_type": "list",
+                }
+            ],
+            default_action=RuleAction.BLOCK,
+            default_severity=RuleSeverity.CRITICAL,
+            configurable_fields=["countries"],
+            tags=["sanctions", "geo"],
+        ),
+        "daily_velocity": RuleTemplate(
+            id="tmpl_daily_velocity",
+            name="Daily Transaction Limit",
+            description="Limit daily transaction count or amount per customer",
+            rule_type=RuleType.VELOCITY,
+            category="fraud",
+            default_conditions=[
+                {
+                    "field": "daily_count",
+                    "operator": "greater_than",
+                    "value": 10,
+                    "value_type": "number",
+                }
+            ],
+            default_action=RuleAction.BLOCK,
+            default_severity=RuleSeverity.MEDIUM,
+            configurable_fields=["daily_count", "daily_amount"],
+            tags=["velocity", "fraud"],
+        ),
+        "unverified_kyc": RuleTemplate(
+            id="tmpl_unverified_kyc",
+            name="Unverified KYC",
+            description="Block transactions for customers without verified KYC",
+            rule_type=RuleType.KYC_VERIFICATION,
+            category="kyc",
+            default_conditions=[
+                {
+                    "field": "kyc_status",
+                    "operator": "not_equals",
+                    "value": "verified",
+                    "value_type": "string",
+                }
+            ],
+            default_action=RuleAction.BLOCK,
+            default_severity=RuleSeverity.HIGH,
+            configurable_fields=["action"],
+            tags=["kyc"],
+        ),
+    }
+)
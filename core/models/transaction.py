@@ -2,11 +2,16 @@
 Transaction domain models
 """
 
+from collections.abc import Set
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import cache
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, model_validator
+
+from ._types import amount_to_minor_units, utcnow
 
 
 class TransactionType(str, Enum):
@@ -31,10 +36,14 @@ class TransactionStatus(str, Enum):
     REVERSED = "reversed"
 
 
+# Statuses in which a transaction is still in flight; matches stored values and members alike
+_PENDING_STATUSES = frozenset({TransactionStatus.PENDING, TransactionStatus.PROCESSING})
+
+
 class Transaction(BaseModel):
     """Transaction model"""
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, frozen=True)
 
     id: str = Field(..., description="Transaction identifier")
     organization_id: str = Field(..., description="Organization identifier")
@@ -45,24 +54,41 @@ class Transaction(BaseModel):
     transaction_type: TransactionType = Field(..., description="Transaction type")
     from_account_id: str | None = Field(default=None, description="Source account")
     to_account_id: str | None = Field(default=None, description="Destination account")
-    amount: Decimal = Field(..., description="Transaction amount")
+    amount_minor: int = Field(..., description="Transaction amount in minor currency units")
+    currency_exponent: int = Field(
+        default=2,
+        ge=0,
+        description="Decimal places of the currency (derived from the code if omitted)",
+    )
     currency: str = Field(default="USD", description="Transaction currency")
     status: TransactionStatus = Field(
         default=TransactionStatus.PENDING, description="Transaction status"
     )
     description: str | None = Field(default=None, description="Transaction description")
     reference: str | None = Field(default=None, description="External reference")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     completed_at: datetime | None = Field(default=None, description="Completion timestamp")
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _amount_to_minor_units(cls, data: Any) -> Any:
+        """Accept a decimal ``amount`` and store it as integer minor units"""
+        return amount_to_minor_units(data, cls.model_fields)
+
+    @computed_field
+    @property
+    def amount(self) -> Decimal:
+        """Transaction amount in major currency units"""
+        return Decimal(self.amount_minor).scaleb(-self.currency_exponent)
+
     def is_completed(self) -> bool:
         """Check if transaction is completed"""
         return self.status == TransactionStatus.COMPLETED
 
     def is_pending(self) -> bool:
         """Check if transaction is pending"""
-        return self.status in [TransactionStatus.PENDING, TransactionStatus.PROCESSING]
+        return self.status in _PENDING_STATUSES
 
     def is_reversible(self) -> bool:
         """Check if transaction can be reversed"""
@@ -70,3 +96,21 @@ class Transaction(BaseModel):
             self.status == TransactionStatus.COMPLETED
             and self.transaction_type != TransactionType.REVERSAL
         )
+
+
+@cache
+def _transaction_list_adapter() -> TypeAdapter[list[Transaction]]:
+    """Serializer for transaction listings, built once on first use"""
+    return TypeAdapter(list[Transaction])
+
+
+def dump_transaction(transaction: Transaction, include: Set[str] | None = None) -> bytes:
+    """Serialize a transaction straight to JSON bytes with the compiled pydantic-core serializer"""
+    return transaction.__pydantic_serializer__.to_json(transaction, include=include)
+
+
+def dump_transactions(transactions: list[Transaction], include: Set[str] | None = None) -> bytes:
+    """Serialize a page of transactions to JSON bytes in a single pydantic-core call"""
+    return _transaction_list_adapter().dump_json(
+        transactions, include=None if include is None else {"__all__": include}
+    )
@@ -2,10 +2,15 @@
 User domain models
 """
 
+from collections.abc import Callable, Iterable, Mapping, Set
 from datetime import datetime
 from enum import Enum
+from functools import cache, cached_property, lru_cache
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from ._types import EMPTY_MAPPING, Email, utcnow
 
 
 class UserRole(str, Enum):
@@ -89,141 +94,192 @@ class Permission(str, Enum):
     COMPLIANCE_REPORTS = "compliance:reports"
 
 
+# Every permission, built once; super admins hold this set
+_ALL_PERMISSIONS: frozenset[Permission] = frozenset(Permission)
+
 # Role-based permission mapping
-ROLE_PERMISSIONS: dict[UserRole, list[Permission]] = {
-    UserRole.SUPER_ADMIN: list(Permission),  # All permissions
-    UserRole.ORG_OWNER: [
-        # Full access to organization resources
-        Permission.ACCOUNTS_READ,
-        Permission.ACCOUNTS_CREATE,
-        Permission.ACCOUNTS_UPDATE,
-        Permission.ACCOUNTS_DELETE,
-        Permission.TRANSACTIONS_READ,
-        Permission.TRANSACTIONS_CREATE,
-        Permission.TRANSACTIONS_APPROVE,
-        Permission.PAYMENTS_READ,
-        Permission.PAYMENTS_CREATE,
-        Permission.PAYMENTS_APPROVE,
-        Permission.PAYMENTS_CANCEL,
-        Permission.CUSTOMERS_READ,
-        Permission.CUSTOMERS_CREATE,
-        Permission.CUSTOMERS_UPDATE,
-        Permission.CUSTOMERS_DELETE,
-        Permission.USERS_READ,
-        Permission.USERS_CREATE,
-        Permission.USERS_UPDATE,
-        Permission.USERS_DELETE,
-        Permission.ORG_READ,
-        Permission.ORG_UPDATE,
-        Permission.ORG_SETTINGS,
-        Permission.CARDS_READ,
-        Permission.CARDS_CREATE,
-        Permission.CARDS_UPDATE,
-        Permission.REPORTS_VIEW,
-        Permission.REPORTS_EXPORT,
-        Permission.AUDIT_READ,
-        Permission.COMPLIANCE_VIEW,
-        Permission.COMPLIANCE_APPROVE,
-        Permission.COMPLIANCE_REJECT,
-        Permission.COMPLIANCE_RULES_MANAGE,
-        Permission.COMPLIANCE_OVERRIDE,
-        Permission.COMPLIANCE_REPORTS,
-    ],
-    UserRole.ORG_ADMIN: [
-        # Most permissions except org settings and user deletion
-        Permission.ACCOUNTS_READ,
-        Permission.ACCOUNTS_CREATE,
-        Permission.ACCOUNTS_UPDATE,
-        Permission.TRANSACTIONS_READ,
-        Permission.TRANSACTIONS_CREATE,
-        Permission.TRANSACTIONS_APPROVE,
-        Permission.PAYMENTS_READ,
-        Permission.PAYMENTS_CREATE,
-        Permission.PAYMENTS_APPROVE,
-        Permission.CUSTOMERS_READ,
-        Permission.CUSTOMERS_CREATE,
-        Permission.CUSTOMERS_UPDATE,
-        Permission.USERS_READ,
-        Permission.USERS_CREATE,
-        Permission.USERS_UPDATE,
-        Permission.ORG_READ,
-        Permission.CARDS_READ,
-        Permission.CARDS_CREATE,
-        Permission.CARDS_UPDATE,
-        Permission.REPORTS_VIEW,
-        Permission.REPORTS_EXPORT,
-        Permission.AUDIT_READ,
-        Permission.COMPLIANCE_VIEW,
-        Permission.COMPLIANCE_APPROVE,
-        Permission.COMPLIANCE_REJECT,
-        Permission.COMPLIANCE_REPORTS,
-    ],
-    UserRole.FINANCE_MANAGER: [
-        # Financial operations
-        Permission.ACCOUNTS_READ,
-        Permission.ACCOUNTS_CREATE,
-        Permission.TRANSACTIONS_READ,
-        Permission.TRANSACTIONS_CREATE,
-        Permission.TRANSACTIONS_APPROVE,
-        Permission.PAYMENTS_READ,
-        Permission.PAYMENTS_CREATE,
-        Permission.PAYMENTS_APPROVE,
-        Permission.PAYMENTS_CANCEL,
-        Permission.CUSTOMERS_READ,
-        Permission.REPORTS_VIEW,
-        Permission.REPORTS_EXPORT,
-        Permission.COMPLIANCE_VIEW,
-        Permission.COMPLIANCE_APPROVE,
-        Permission.COMPLIANCE_REPORTS,
-    ],
-    UserRole.ACCOUNTANT: [
-        # Read and limited write
-        Permission.ACCOUNTS_READ,
-        Permission.TRANSACTIONS_READ,
-        Permission.PAYMENTS_READ,
-        Permission.CUSTOMERS_READ,
-        Permission.REPORTS_VIEW,
-        Permission.REPORTS_EXPORT,
-        Permission.AUDIT_READ,
-    ],
-    UserRole.DEVELOPER: [
-        # API access
-        Permission.ACCOUNTS_READ,
-        Permission.ACCOUNTS_CREATE,
-        Permission.TRANSACTIONS_READ,
-        Permission.TRANSACTIONS_CREATE,
-        Permission.PAYMENTS_READ,
-        Permission.PAYMENTS_CREATE,
-        Permission.CUSTOMERS_READ,
-        Permission.CUSTOMERS_CREATE,
-    ],
-    UserRole.SUPPORT: [
-        # Read-only for support
-        Permission.ACCOUNTS_READ,
-        Permission.TRANSACTIONS_READ,
-        Permission.PAYMENTS_READ,
-        Permission.CUSTOMERS_READ,
-        Permission.CUSTOMERS_UPDATE,
-    ],
-    UserRole.VIEWER: [
-        # Read-only
-        Permission.ACCOUNTS_READ,
-        Permission.TRANSACTIONS_READ,
-        Permission.PAYMENTS_READ,
-        Permission.CUSTOMERS_READ,
-        Permission.REPORTS_VIEW,
-    ],
+ROLE_PERMISSIONS: dict[UserRole, frozenset[Permission]] = {
+    UserRole.SUPER_ADMIN: _ALL_PERMISSIONS,
+    UserRole.ORG_OWNER: frozenset(
+        {
+            # Full access to organization resources
+            Permission.ACCOUNTS_READ,
+            Permission.ACCOUNTS_CREATE,
+            Permission.ACCOUNTS_UPDATE,
+            Permission.ACCOUNTS_DELETE,
+            Permission.TRANSACTIONS_READ,
+            Permission.TRANSACTIONS_CREATE,
+            Permission.TRANSACTIONS_APPROVE,
+            Permission.PAYMENTS_READ,
+            Permission.PAYMENTS_CREATE,
+            Permission.PAYMENTS_APPROVE,
+            Permission.PAYMENTS_CANCEL,
+            Permission.CUSTOMERS_READ,
+            Permission.CUSTOMERS_CREATE,
+            Permission.CUSTOMERS_UPDATE,
+            Permission.CUSTOMERS_DELETE,
+            Permission.USERS_READ,
+            Permission.USERS_CREATE,
+            Permission.USERS_UPDATE,
+            Permission.USERS_DELETE,
+            Permission.ORG_READ,
+            Permission.ORG_UPDATE,
+            Permission.ORG_SETTINGS,
+            Permission.CARDS_READ,
+            Permission.CARDS_CREATE,
+            Permission.CARDS_UPDATE,
+            Permission.REPORTS_VIEW,
+            Permission.REPORTS_EXPORT,
+            Permission.AUDIT_READ,
+            Permission.COMPLIANCE_VIEW,
+            Permission.COMPLIANCE_APPROVE,
+            Permission.COMPLIANCE_REJECT,
+            Permission.COMPLIANCE_RULES_MANAGE,
+            Permission.COMPLIANCE_OVERRIDE,
+            Permission.COMPLIANCE_REPORTS,
+        }
+    ),
+    UserRole.ORG_ADMIN: frozenset(
+        {
+            # Most permissions except org settings and user deletion
+            Permission.ACCOUNTS_READ,
+            Permission.ACCOUNTS_CREATE,
+            Permission.ACCOUNTS_UPDATE,
+            Permission.TRANSACTIONS_READ,
+            Permission.TRANSACTIONS_CREATE,
+            Permission.TRANSACTIONS_APPROVE,
+            Permission.PAYMENTS_READ,
+            Permission.PAYMENTS_CREATE,
+            Permission.PAYMENTS_APPROVE,
+            Permission.CUSTOMERS_READ,
+            Permission.CUSTOMERS_CREATE,
+            Permission.CUSTOMERS_UPDATE,
+            Permission.USERS_READ,
+            Permission.USERS_CREATE,
+            Permission.USERS_UPDATE,
+            Permission.ORG_READ,
+            Permission.CARDS_READ,
+            Permission.CARDS_CREATE,
+            Permission.CARDS_UPDATE,
+            Permission.REPORTS_VIEW,
+            Permission.REPORTS_EXPORT,
+            Permission.AUDIT_READ,
+            Permission.COMPLIANCE_VIEW,
+            Permission.COMPLIANCE_APPROVE,
+            Permission.COMPLIANCE_REJECT,
+            Permission.COMPLIANCE_REPORTS,
+        }
+    ),
+    UserRole.FINANCE_MANAGER: frozenset(
+        {
+            # Financial operations
+            Permission.ACCOUNTS_READ,
+            Permission.ACCOUNTS_CREATE,
+            Permission.TRANSACTIONS_READ,
+            Permission.TRANSACTIONS_CREATE,
+            Permission.TRANSACTIONS_APPROVE,
+            Permission.PAYMENTS_READ,
+            Permission.PAYMENTS_CREATE,
+            Permission.PAYMENTS_APPROVE,
+            Permission.PAYMENTS_CANCEL,
+            Permission.CUSTOMERS_READ,
+            Permission.REPORTS_VIEW,
+            Permission.REPORTS_EXPORT,
+            Permission.COMPLIANCE_VIEW,
+            Permission.COMPLIANCE_APPROVE,
+            Permission.COMPLIANCE_REPORTS,
+        }
+    ),
+    UserRole.ACCOUNTANT: frozenset(
+        {
+            # Read and limited write
+            Permission.ACCOUNTS_READ,
+            Permission.TRANSACTIONS_READ,
+            Permission.PAYMENTS_READ,
+            Permission.CUSTOMERS_READ,
+            Permission.REPORTS_VIEW,
+            Permission.REPORTS_EXPORT,
+            Permission.AUDIT_READ,
+        }
+    ),
+    UserRole.DEVELOPER: frozenset(
+        {
+            # API access
+            Permission.ACCOUNTS_READ,
+            Permission.ACCOUNTS_CREATE,
+            Permission.TRANSACTIONS_READ,
+            Permission.TRANSACTIONS_CREATE,
+            Permission.PAYMENTS_READ,
+            Permission.PAYMENTS_CREATE,
+            Permission.CUSTOMERS_READ,
+            Permission.CUSTOMERS_CREATE,
+        }
+    ),
+    UserRole.SUPPORT: frozenset(
+        {
+            # Read-only for support
+            Permission.ACCOUNTS_READ,
+            Permission.TRANSACTIONS_READ,
+            Permission.PAYMENTS_READ,
+            Permission.CUSTOMERS_READ,
+            Permission.CUSTOMERS_UPDATE,
+        }
+    ),
+    UserRole.VIEWER: frozenset(
+        {
+            # Read-only
+            Permission.ACCOUNTS_READ,
+            Permission.TRANSACTIONS_READ,
+            Permission.PAYMENTS_READ,
+            Permission.CUSTOMERS_READ,
+            Permission.REPORTS_VIEW,
+        }
+    ),
+}
+
+# Shared empty set for roles without a permission mapping
+_NO_PERMISSIONS: frozenset[Permission] = frozenset()
+
+# Per-role membership check, bound once to each role set's C-level __contains__
+_PERMISSION_CHECKS: dict[UserRole, Callable[[Permission], bool]] = {
+    role: permissions.__contains__ for role, permissions in ROLE_PERMISSIONS.items()
 }
 
 
+# Inverse of ROLE_PERMISSIONS for permission-centric queries ("who can do X?")
+_ROLES_BY_PERMISSION: dict[Permission, frozenset[UserRole]] = {
+    permission: frozenset(
+        role for role, permissions in ROLE_PERMISSIONS.items() if permission in permissions
+    )
+    for permission in Permission
+}
+
+
+def roles_with_permission(permission: Permission) -> frozenset[UserRole]:
+    """Get the roles that grant a permission"""
+    return _ROLES_BY_PERMISSION.get(permission, frozenset())
+
+
+# Keys include per-user custom grants, so bound the cache rather than letting it grow with users
+@lru_cache(maxsize=1024)
+def _resolve_permissions(role: UserRole, custom: tuple[Permission, ...]) -> frozenset[Permission]:
+    """Role permissions plus custom grants, shared across users with the same combination"""
+    return ROLE_PERMISSIONS.get(role, _NO_PERMISSIONS).union(custom)
+
+
+# cached_property values derived from role, permissions and accessible_branches;
+# model_copy(update=...) would otherwise carry them over to a changed copy
+_DERIVED_ATTRS = ("_permission_set", "perm_check", "_accessible_branch_set")
+
+
 class User(BaseModel):
     """User model"""
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, frozen=True)
 
     id: str = Field(..., description="User identifier")
     organization_id: str = Field(..., description="Organization ID")
-    email: EmailStr = Field(..., description="User email")
+    email: Email = Field(..., description="User email")
     first_name: str = Field(..., description="First name")
     last_name: str = Field(..., description="Last name")
     phone: str | None = Field(default=None, description="Phone number")
@@ -237,16 +293,16 @@ class User(BaseModel):
 
     # Authorization
     role: UserRole = Field(..., description="User role")
-    permissions: list[Permission] = Field(
-        default_factory=list, description="Additional custom permissions"
+    permissions: tuple[Permission, ...] = Field(
+        default=(), description="Additional custom permissions"
     )
 
     # Branch access (NEW for multi-branch support)
     primary_branch_id: str | None = Field(
         None, description="User's primary branch (None for org-wide users)"
     )
-    accessible_branches: list[str] = Field(
-        default_factory=list, description="Branches user can access (empty list = all branches)"
+    accessible_branches: tuple[str, ...] = Field(
+        default=(), description="Branches user can access (empty = all branches)"
     )
 
     # Status
@@ -259,10 +315,10 @@ class User(BaseModel):
     two_factor_secret: str | None = Field(default=None, description="2FA secret", exclude=True)
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     updated_at: datetime | None = Field(default=None, description="Last update timestamp")
     created_by: str | None = Field(default=None, description="Created by user ID")
-    metadata: dict = Field(default_factory=dict, description="Additional metadata")
+    metadata: Mapping[str, Any] = Field(default=EMPTY_MAPPING, description="Additional metadata")
 
     @property
     def full_name(self) -> str:
@@ -281,14 +337,43 @@ class User(BaseModel):
         """Check if user can login"""
         return self.is_active() and self.is_email_verified() and self.status != UserStatus.LOCKED
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> "User":
+        """Copy the user, dropping cached derived state that the update may invalidate"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _DERIVED_ATTRS:
+                copied.__dict__.pop(name, None)
+        return copied
+
+    @cached_property
+    def _permission_set(self) -> frozenset[Permission]:
+        """Effective permissions, resolved once per (frozen) user"""
+        if not self.permissions:
+            # Common case: no custom grants, so the role's prebuilt set is the answer
+            return ROLE_PERMISSIONS.get(self.role, _NO_PERMISSIONS)
+        return _resolve_permissions(self.role, tuple(self.permissions))
+
+    @cached_property
+    def perm_check(self) -> Callable[[Permission], bool]:
+        """
+        Bound membership test over the effective permissions
+
+        For callers checking several permissions against the same user, e.g.
+        ``check = user.perm_check; check(Permission.X) and check(Permission.Y)``.
+        """
+        return self._permission_set.__contains__
+
     def get_all_permissions(self) -> list[Permission]:
         """Get all permissions (role-based + custom)"""
-        role_perms = ROLE_PERMISSIONS.get(self.role, [])
-        return list(set(role_perms + self.permissions))
+        return list(self._permission_set)
 
     def has_permission(self, permission: Permission) -> bool:
         """Check if user has a specific permission"""
-        return permission in self.get_all_permissions()
+        if self.role == UserRole.SUPER_ADMIN:
+            return True
+        # Role set first: custom grants are rare, so this usually skips the union entirely
+        check = _PERMISSION_CHECKS.get(self.role)
+        return (check is not None and check(permission)) or permission in self.permissions
 
     def has_branch_access(self, branch_id: str) -> bool:
         """
@@ -304,28 +389,33 @@ class User(BaseModel):
         if not self.accessible_branches:
             return True
 
-        # Check if branch in user's accessible list
-        return branch_id in self.accessible_branches
+        # Check if branch in user's accessible set
+        return branch_id in self._accessible_branch_set
+
+    @cached_property
+    def _accessible_branch_set(self) -> frozenset[str]:
+        """Accessible branches hashed once per (frozen) user for O(1) checks"""
+        return frozenset(self.accessible_branches)
 
     def can_access_all_branches(self) -> bool:
         """Check if user has organization-wide access"""
         return not self.accessible_branches
 
-    def has_any_permission(self, permissions: list[Permission]) -> bool:
+    def has_any_permission(self, permissions: Iterable[Permission]) -> bool:
         """Check if user has any of the specified permissions"""
-        user_perms = self.get_all_permissions()
-        return any(perm in user_perms for perm in permissions)
+        return not self._permission_set.isdisjoint(permissions)
 
-    def has_all_permissions(self, permissions: list[Permission]) -> bool:
+    def has_all_permissions(self, permissions: Iterable[Permission]) -> bool:
         """Check if user has all of the specified permissions"""
-        user_perms = self.get_all_permissions()
-        return all(perm in user_perms for perm in permissions)
+        if self.role == UserRole.SUPER_ADMIN:
+            return True
+        return self._permission_set.issuperset(permissions)
 
 
 class UserSession(BaseModel):
     """User session model"""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: str = Field(..., description="Session identifier")
     user_id: str = Field(..., description="User ID")
@@ -335,9 +425,31 @@ class UserSession(BaseModel):
     ip_address: str | None = Field(default=None, description="IP address")
     user_agent: str | None = Field(default=None, description="User agent")
     expires_at: datetime = Field(..., description="Session expiration")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
     last_accessed_at: datetime | None = Field(default=None, description="Last access timestamp")
 
     def is_expired(self) -> bool:
         """Check if session is expired"""
-        return datetime.utcnow() > self.expires_at
+        now = utcnow()
+        if self.expires_at.tzinfo is None:
+            # Sessions stored before expiries became timezone-aware hold naive UTC
+            now = now.replace(tzinfo=None)
+        return now > self.expires_at
+
+
+@cache
+def _user_list_adapter() -> TypeAdapter[list[User]]:
+    """Serializer for user listings, built once on first use"""
+    return TypeAdapter(list[User])
+
+
+def dump_user(user: User, include: Set[str] | None = None) -> bytes:
+    """Serialize a user straight to JSON bytes; secret fields stay excluded"""
+    return user.__pydantic_serializer__.to_json(user, include=include)
+
+
+def dump_users(users: list[User], include: Set[str] | None = None) -> bytes:
+    """Serialize a page of users to JSON bytes in a single pydantic-core call"""
+    return _user_list_adapter().dump_json(
+        users, include=None if include is None else {"__all__": include}
+    )
@@ -16,6 +16,9 @@ from ..models.user import Permission, UserRole, UserStatus
 
 logger = logging.getLogger(__name__)
 
+# Shared zero balance; Decimals are immutable, so one instance serves every placeholder
+_ZERO = Decimal(0)
+
 
 class FormanceRepository:
     """Repository for Formance API operations"""
@@ -40,8 +43,8 @@ class FormanceRepository:
             "customer_id": customer_id,
             "account_type": account_type,
             "currency": currency,
-            "balance": Decimal("0"),
-            "available_balance": Decimal("0"),
+            "balance": _ZERO,
+            "available_balance": _ZERO,
             "status": "active",
             "metadata": metadata,
         }
@@ -54,7 +57,7 @@ class FormanceRepository:
     async def get_account_balance(self, account_id: str) -> Decimal:
         """Get account balance"""
         # TODO: Implement actual Formance SDK call
-        return Decimal("0")
+        return _ZERO
 
     async def list_accounts_by_customer(self, customer_id: str) -> list[dict]:
         """List accounts for a customer"""
@@ -145,7 +148,7 @@ class FormanceRepository:
             Destination: mobile_money:{provider}:{phone_number}
         """
         import secrets
-        from datetime import datetime
+        from datetime import UTC, datetime
 
         payment_id = f"pay_{secrets.token_hex(12)}"
 
@@ -167,7 +170,7 @@ class FormanceRepository:
             #             "metadata": {
             #                 **metadata,
             #                 "description": description,
-            #                 "created_at": datetime.utcnow().isoformat(),
+            #                 "created_at": datetime.now(UTC).isoformat(),
             #             },
             #         }
             #     }
@@ -187,9 +190,9 @@ class FormanceRepository:
                 "metadata": {
                     **metadata,
                     "formance_payment_id": payment_id,
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": datetime.now(UTC).isoformat(),
                 },
-                "created_at": datetime.utcnow(),
+                "created_at": datetime.now(UTC),
             }
         except Exception as e:
             logger.error(f"Failed to create Formance payment: {e}")
@@ -222,7 +225,7 @@ class FormanceRepository:
     ) -> dict:
         """Create a customer"""
         # TODO: Implement actual Formance SDK call or local DB
-        customer_id = f"cust_{email.split('@')[0]}"
+        customer_id = f"cust_{email.partition('@')[0]}"
         return {
             "id": customer_id,
             "email": email,
@@ -358,7 +361,7 @@ class FormanceRepository:
             - customer_id: Customer ID
         """
         import secrets
-        from datetime import datetime
+        from datetime import UTC, datetime
 
         try:
             transaction_id = f"txn_{secrets.token_hex(12)}"
@@ -373,10 +376,10 @@ class FormanceRepository:
             #             "reference": reference or transaction_id,
             #             "metadata": {
             #                 **metadata,
-            #                 "created_at": datetime.utcnow().isoformat(),
+            #                 "created_at": datetime.now(UTC).isoformat(),
             #                 "ledger_id": ledger_id,
             #             },
-            #             "timestamp": datetime.utcnow().isoformat(),
+            #             "timestamp": datetime.now(UTC).isoformat(),
             #         }
             #     }
             # )
@@ -394,9 +397,9 @@ class FormanceRepository:
                 "metadata": {
                     **metadata,
                     "formance_transaction_id": transaction_id,
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": datetime.now(UTC).isoformat(),
                 },
-                "timestamp": datetime.utcnow(),
+                "timestamp": datetime.now(UTC),
             }
         except Exception as e:
             logger.error(f"Failed to post transaction to Formance ledger: {e}")
@@ -450,7 +453,7 @@ class FormanceRepository:
     ) -> dict:
         """Create an organization"""
         # TODO: Implement actual storage call (PostgreSQL, MongoDB, etc.)
-        from datetime import datetime
+        from datetime import UTC, datetime
 
         org_id = f"org_{name.lower().replace(' ', '_')}"
         return {
@@ -472,7 +475,7 @@ class FormanceRepository:
             "kyb_status": "not_started",
             "verified_at": None,
             "settings": settings.model_dump(),
-            "created_at": datetime.utcnow(),
+            "created_at": datetime.now(UTC),
             "updated_at": None,
             "created_by": created_by,
             "metadata": metadata,
@@ -486,9 +489,9 @@ class FormanceRepository:
     async def update_organization(self, organization_id: str, update_data: dict) -> dict:
         """Update organization"""
         # TODO: Implement actual storage call
-        from datetime import datetime
+        from datetime import UTC, datetime
 
-        update_data["updated_at"] = datetime.utcnow()
+        update_data["updated_at"] = datetime.now(UTC)
         return {}
 
     async def list_organizations(self, limit: int, offset: int, status: str | None) -> list[dict]:
@@ -512,9 +515,9 @@ class FormanceRepository:
     ) -> dict:
         """Create a user"""
         # TODO: Implement actual storage call (PostgreSQL, MongoDB, etc.)
-        from datetime import datetime
+        from datetime import UTC, datetime
 
-        user_id = f"usr_{email.split('@')[0]}"
+        user_id = f"usr_{email.partition('@')[0]}"
         return {
             "id": user_id,
             "organization_id": organization_id,
@@ -532,7 +535,7 @@ class FormanceRepository:
             "failed_login_attempts": 0,
             "two_factor_enabled": False,
             "two_factor_secret": None,
-            "created_at": datetime.utcnow(),
+            "created_at": datetime.now(UTC),
             "updated_at": None,
             "created_by": created_by,
             "metadata": metadata,
@@ -551,9 +554,9 @@ class FormanceRepository:
     async def update_user(self, user_id: str, update_data: dict) -> dict:
         """Update user"""
         # TODO: Implement actual storage call
-        from datetime import datetime
+        from datetime import UTC, datetime
 
-        update_data["updated_at"] = datetime.utcnow()
+        update_data["updated_at"] = datetime.now(UTC)
         return {}
 
     async def list_organization_users(
@@ -582,7 +585,7 @@ class FormanceRepository:
         """Create a user session"""
         # TODO: Implement actual storage call (Redis, PostgreSQL, etc.)
         import secrets
-        from datetime import datetime
+        from datetime import UTC, datetime
 
         session_id = f"sess_{secrets.token_hex(8)}"
         return {
@@ -594,7 +597,7 @@ class FormanceRepository:
             "ip_address": ip_address,
             "user_agent": user_agent,
             "expires_at": expires_at,
-            "created_at": datetime.utcnow(),
+            "created_at": datetime.now(UTC),
             "last_accessed_at": None,
         }
 
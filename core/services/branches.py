@@ -4,10 +4,11 @@ Branch management service
 
 import logging
 import secrets
-from datetime import datetime
+from datetime import UTC, datetime
 
 from ..exceptions import NotFoundError, ValidationError
 from ..models.branch import (
+    DEFAULT_BRANCH_SETTINGS,
     Branch,
     BranchPerformanceMetrics,
     BranchSettings,
@@ -110,7 +111,7 @@ class BranchService:
             latitude=latitude,
             longitude=longitude,
             manager_user_id=manager_user_id,
-            settings=settings or BranchSettings(),
+            settings=settings or DEFAULT_BRANCH_SETTINGS,
             metadata=metadata or {},
         )
 
@@ -186,7 +187,7 @@ class BranchService:
             branch_id,
             {
                 "status": BranchStatus.ACTIVE,
-                "opened_at": datetime.utcnow(),
+                "opened_at": datetime.now(UTC),
             },
         )
 
@@ -200,7 +201,7 @@ class BranchService:
             branch_id,
             {
                 "status": BranchStatus.CLOSED,
-                "closed_at": datetime.utcnow(),
+                "closed_at": datetime.now(UTC),
             },
         )
 
@@ -232,7 +233,7 @@ class BranchService:
             "branch_id": branch_id,
             "role_at_branch": role_at_branch,
             "is_primary": is_primary,
-            "assigned_at": datetime.utcnow(),
+            "assigned_at": datetime.now(UTC),
         }
 
         logger.info(f"User {user_id} assigned to branch {branch_id}")
@@ -11,7 +11,7 @@ Integrates with:
 
 import logging
 import secrets
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 from ..exceptions import (
@@ -26,6 +26,7 @@ from ..models.compliance import (
     ComplianceStatus,
     RiskScore,
     SanctionListType,
+    SanctionMatchSummary,
 )
 from ..models.customer import Customer
 from ..models.organization import Organization, OrganizationSettings
@@ -66,7 +67,7 @@ class ComplianceService:
         self.country_risk = country_risk_assessment
 
         # In-memory rule cache (in production, use Redis)
-        self._rules_cache: dict[str, list[ComplianceRule]] = {}
+        self._rules_cache: dict[str, tuple[ComplianceRule, ...]] = {}
         self._rules_cache_ttl = timedelta(minutes=15)
         self._rules_cache_timestamp: datetime | None = None
 
@@ -156,7 +157,7 @@ class ComplianceService:
 
             # 1. KYC/KYB Verification Check
             kyc_result = await self._check_kyc_verification(customer, org)
-            compliance_check.rules_evaluated.append("kyc_verification")
+            compliance_check.rules_evaluated += ("kyc_verification",)
             if kyc_result["blocked"]:
                 compliance_check.status = ComplianceStatus.BLOCKED
                 compliance_check.reason = kyc_result["reason"]
@@ -166,8 +167,10 @@ class ComplianceService:
 
             # 2. Sanctions Screening
             sanctions_result = await self._check_sanctions(customer, org.settings)
-            compliance_check.rules_evaluated.append("sanctions_screening")
-            compliance_check.sanctions_matches = sanctions_result["matches"]
+            compliance_check.rules_evaluated += ("sanctions_screening",)
+            compliance_check.sanctions_matches = [
+                SanctionMatchSummary.model_validate(match) for match in sanctions_result["matches"]
+            ]
             if sanctions_result["blocked"]:
                 compliance_check.status = ComplianceStatus.BLOCKED
                 compliance_check.reason = "Sanctions screening failed"
@@ -179,7 +182,7 @@ class ComplianceService:
             org_check = await self._check_organization_settings(
                 org.settings, amount, currency, payment_method, destination_country
             )
-            compliance_check.rules_evaluated.append("organization_settings")
+            compliance_check.rules_evaluated += ("organization_settings",)
             if org_check["blocked"]:
                 compliance_check.status = ComplianceStatus.BLOCKED
                 compliance_check.reason = org_check["reason"]
@@ -190,7 +193,7 @@ class ComplianceService:
             velocity_result = await self._check_velocity(
                 organization_id, customer_id, account_id, amount, org.settings
             )
-            compliance_check.rules_evaluated.append("velocity_check")
+            compliance_check.rules_evaluated += ("velocity_check",)
             if velocity_result["blocked"]:
                 compliance_check.status = ComplianceStatus.BLOCKED
                 compliance_check.reason = velocity_result["reason"]
@@ -200,7 +203,7 @@ class ComplianceService:
             # 5. Geographic Risk Check
             if destination_country:
                 geo_result = await self._check_geographic_risk(destination_country, org.settings)
-                compliance_check.rules_evaluated.append("geographic_risk")
+                compliance_check.rules_evaluated += ("geographic_risk",)
                 if geo_result["blocked"]:
                     compliance_check.status = ComplianceStatus.BLOCKED
                     compliance_check.reason = geo_result["reason"]
@@ -209,8 +212,10 @@ class ComplianceService:
 
             # 6. Evaluate Custom Rules
             rules_result = await self._evaluate_rules(organization_id, context)
-            compliance_check.rules_evaluated.extend([r.rule_id for r in rules_result])
-            compliance_check.rules_triggered = [r.rule_id for r in rules_result if r.triggered]
+            compliance_check.rules_evaluated += tuple(r.rule_id for r in rules_result)
+            compliance_check.rules_triggered = frozenset(
+                r.rule_id for r in rules_result if r.triggered
+            )
 
             # Check for blocking rules
             for result in rules_result:
@@ -309,9 +314,8 @@ class ComplianceService:
             return {"blocked": False, "matches": []}
 
         # Screen customer name
-        full_name = f"{customer.first_name} {customer.last_name}"
         matches = self.sanctions.screen(
-            full_name,
+            customer.full_name,
             list_types=[
                 SanctionListType.OFAC,
                 SanctionListType.UN,
@@ -454,11 +458,11 @@ class ComplianceService:
 
         return results
 
-    async def _get_rules(self, organization_id: str) -> list[ComplianceRule]:
+    async def _get_rules(self, organization_id: str) -> tuple[ComplianceRule, ...]:
         """Get rules for organization with caching"""
         # Check cache
         if self._rules_cache_timestamp:
-            age = datetime.utcnow() - self._rules_cache_timestamp
+            age = datetime.now(UTC) - self._rules_cache_timestamp
             if age < self._rules_cache_ttl and organization_id in self._rules_cache:
                 return self._rules_cache[organization_id]
 
@@ -466,11 +470,12 @@ class ComplianceService:
         # For now, return empty list
         rules = []
 
-        # Cache rules
-        self._rules_cache[organization_id] = rules
-        self._rules_cache_timestamp = datetime.utcnow()
+        # Cache rules in priority order so evaluation never re-sorts
+        compiled = tuple(sorted(rules, key=lambda rule: rule.priority))
+        self._rules_cache[organization_id] = compiled
+        self._rules_cache_timestamp = datetime.now(UTC)
 
-        return rules
+        return compiled
 
     async def _calculate_risk_score(
         self,
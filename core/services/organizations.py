@@ -10,6 +10,7 @@ from ..models.organization import (
     OrganizationSettings,
     OrganizationStatus,
     OrganizationType,
+    default_organization_settings,
 )
 from ..repositories.formance import FormanceRepository
 
@@ -81,7 +82,7 @@ class OrganizationService:
             address_country=address_country,
             tax_id=tax_id,
             registration_number=registration_number,
-            settings=settings or OrganizationSettings(),
+            settings=settings or default_organization_settings(),
             created_by=created_by,
             metadata=metadata or {},
         )
@@ -198,13 +199,13 @@ class OrganizationService:
         Returns:
             Updated Organization object
         """
-        from datetime import datetime
+        from datetime import UTC, datetime
 
         logger.info(f"Verifying organization: {organization_id}")
 
         return await self.update_organization(
             organization_id,
-            {"kyb_status": "verified", "verified_at": datetime.utcnow()},
+            {"kyb_status": "verified", "verified_at": datetime.now(UTC)},
         )
 
     async def list_organizations(
@@ -5,7 +5,13 @@ Payment processing service
 import logging
 from decimal import Decimal
 
-from ..models.payment import MobileMoneyProvider, Payment, PaymentMethod, PaymentStatus
+from ..models.payment import (
+    MobileMoneyProvider,
+    Payment,
+    PaymentMethod,
+    PaymentStatus,
+    validate_payments,
+)
 from ..repositories.formance import FormanceRepository
 from ..utils.validators import (
     validate_country_code,
@@ -100,7 +106,7 @@ class PaymentService:
             limit=limit,
             offset=offset,
         )
-        return [Payment(**data) for data in payments_data]
+        return validate_payments(payments_data)
 
     async def cancel_payment(self, payment_id: str) -> Payment:
         """
@@ -11,7 +11,7 @@ This service handles:
 
 import logging
 import secrets
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 from ..exceptions import (
@@ -28,14 +28,15 @@ from ..models.organization import Organization
 from ..models.regulatory import (
     CurrencyTransactionReport,
     FinancialInstitution,
+    IndividualSubject,
     RegulatoryReportingConfig,
     RegulatoryReportSummary,
     ReportPriority,
     ReportStatus,
     ReportType,
-    SubjectInformation,
     SuspiciousActivityReport,
     SuspiciousActivityType,
+    TransactionBatch,
     TransactionDetails,
 )
 from ..repositories.formance import FormanceRepository
@@ -117,6 +118,45 @@ class RegulatoryReportingService:
 
         return False
 
+    async def scan_aggregated_transactions(
+        self,
+        organization_id: str,
+        transactions: list[TransactionDetails],
+    ) -> dict:
+        """
+        Scan a customer's transactions for aggregated CTR and structuring patterns
+
+        Uses the organization's CTR threshold and aggregation window.
+
+        Args:
+            organization_id: Organization ID
+            transactions: Customer transactions to scan
+
+        Returns:
+            Dict with transaction IDs at which the windowed total reaches the CTR
+            threshold ("ctr") and where it does so using only sub-threshold
+            transactions ("structuring")
+        """
+        config = await self._get_reporting_config(organization_id)
+        if not config.ctr_enabled:
+            return {"ctr": [], "structuring": []}
+
+        batch = TransactionBatch.from_details(transactions)
+        window_seconds = config.ctr_aggregation_window_hours * 3600
+        threshold_cents = config.ctr_threshold_cents
+
+        structuring = batch.structuring_breaches(window_seconds, threshold_cents)
+        if structuring:
+            logger.warning(
+                f"Possible structuring detected in org {organization_id}: "
+                f"{len(structuring)} window(s) reach threshold {config.ctr_threshold}"
+            )
+
+        return {
+            "ctr": batch.ctr_breaches(window_seconds, threshold_cents),
+            "structuring": structuring,
+        }
+
     async def check_sar_required(
         self,
         organization_id: str,
@@ -213,9 +253,9 @@ class RegulatoryReportingService:
             # Get transactions
             # TODO: Fetch actual transactions from database
             transactions: list[TransactionDetails] = []
-            total_cash_in = Decimal("0")
-            total_cash_out = Decimal("0")
-            transaction_date = datetime.utcnow()
+            cash_in_cents = 0
+            cash_out_cents = 0
+            transaction_date = datetime.now(UTC)
 
             for txn_id in transaction_ids:
                 # Mock transaction - replace with actual fetch
@@ -230,12 +270,15 @@ class RegulatoryReportingService:
                 )
                 transactions.append(txn_detail)
 
-                if txn_detail.transaction_type in ["deposit", "cash_deposit"]:
-                    total_cash_in += txn_detail.amount
+                if txn_detail.transaction_type in ("deposit", "cash_deposit"):
+                    cash_in_cents += txn_detail.amount_cents
                 else:
-                    total_cash_out += txn_detail.amount
+                    cash_out_cents += txn_detail.amount_cents
 
-            total_amount = total_cash_in + total_cash_out
+            # Aggregate in integer cents; convert back to Decimal once per total
+            total_cash_in = Decimal(cash_in_cents).scaleb(-2)
+            total_cash_out = Decimal(cash_out_cents).scaleb(-2)
+            total_amount = Decimal(cash_in_cents + cash_out_cents).scaleb(-2)
 
             # Build filing institution info
             filing_institution = self._build_filing_institution(org)
@@ -264,7 +307,6 @@ class RegulatoryReportingService:
                 identification_verified=customer.is_kyc_verified(),
                 verification_method="kyc_process",
                 prepared_by=prepared_by,
-                created_at=datetime.utcnow(),
             )
 
             # Store CTR (TODO: Implement storage)
@@ -336,7 +378,7 @@ class RegulatoryReportingService:
             # Get transactions
             # TODO: Fetch actual transactions from database
             transactions: list[TransactionDetails] = []
-            total_amount = Decimal("0")
+            total_cents = 0
 
             for txn_id in transaction_ids:
                 # Mock transaction - replace with actual fetch
@@ -348,7 +390,9 @@ class RegulatoryReportingService:
                     currency="USD",
                 )
                 transactions.append(txn_detail)
-                total_amount += txn_detail.amount
+                total_cents += txn_detail.amount_cents
+
+            total_amount = Decimal(total_cents).scaleb(-2)
 
             # Build filing institution info
             filing_institution = self._build_filing_institution(org)
@@ -366,17 +410,16 @@ class RegulatoryReportingService:
                 filing_institution=filing_institution,
                 activity_start_date=activity_start_date,
                 activity_end_date=activity_end_date,
-                activity_detected_date=datetime.utcnow(),
+                activity_detected_date=datetime.now(UTC),
                 subjects=subjects,
                 suspicious_activity_types=suspicious_activity_types,
                 transactions=transactions,
                 total_amount=total_amount,
                 total_currency="USD",
                 narrative_summary=narrative_summary,
-                compliance_check_ids=compliance_check_ids or [],
-                alert_ids=alert_ids or [],
+                compliance_check_ids=compliance_check_ids or (),
+                alert_ids=alert_ids or (),
                 prepared_by=prepared_by,
-                created_at=datetime.utcnow(),
             )
 
             # Store SAR (TODO: Implement storage)
@@ -466,7 +509,7 @@ class RegulatoryReportingService:
             # Update report status
             # report.status = ReportStatus.FILED
             # report.filed_by = filed_by
-            # report.filed_at = datetime.utcnow()
+            # report.filed_at = datetime.now(UTC)
             # report.bsa_identifier = bsa_identifier
 
             # TODO: Save updated report
@@ -572,20 +615,19 @@ class RegulatoryReportingService:
         return FinancialInstitution(
             name=org.name,
             ein=org.tax_id,
-            address_street=org.address.street if org.address else "Unknown",
-            address_city=org.address.city if org.address else "Unknown",
-            address_state=org.address.state if org.address else None,
-            address_postal_code=org.address.postal_code if org.address else "00000",
-            address_country=org.address.country if org.address else "US",
+            address_street=org.address_street or "Unknown",
+            address_city=org.address_city or "Unknown",
+            address_state=org.address_state,
+            address_postal_code=org.address_postal_code or "00000",
+            address_country=org.address_country,
             phone=org.phone or "+10000000000",
             email=org.email,
             type_of_filing_institution=org.organization_type.value,
         )
 
-    def _build_subject_info(self, customer: Customer) -> SubjectInformation:
+    def _build_subject_info(self, customer: Customer) -> IndividualSubject:
         """Build subject information from customer"""
-        return SubjectInformation(
-            entity_type="individual",
+        return IndividualSubject(
             first_name=customer.first_name,
             last_name=customer.last_name,
             email=customer.email,
@@ -5,7 +5,7 @@ User management and authentication service
 import hashlib
 import logging
 import secrets
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from ..exceptions import ValidationError
 from ..models.user import Permission, User, UserRole, UserSession, UserStatus
@@ -221,7 +221,7 @@ class UserService:
             user_id,
             {
                 "email_verified": True,
-                "email_verified_at": datetime.utcnow(),
+                "email_verified_at": datetime.now(UTC),
                 "status": UserStatus.ACTIVE.value,
             },
         )
@@ -322,7 +322,7 @@ class UserService:
         if user.failed_login_attempts > 0:
             await self.update_user(
                 user.id,
-                {"failed_login_attempts": 0, "last_login_at": datetime.utcnow()},
+                {"failed_login_attempts": 0, "last_login_at": datetime.now(UTC)},
             )
 
         # Create session
@@ -350,7 +350,7 @@ class UserService:
         """
         token = self._generate_token()
         refresh_token = self._generate_token()
-        expires_at = datetime.utcnow() + timedelta(hours=24)
+        expires_at = datetime.now(UTC) + timedelta(hours=24)
 
         session_data = await self.formance_repo.create_user_session(
             user_id=user.id,
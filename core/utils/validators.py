@@ -10,6 +10,10 @@ from ..exceptions import (
     InvalidCurrencyError,
     ValidationError,
 )
+from ..models._types import E164_PATTERN, ISO_3166_ALPHA2
+
+# Compiled once; shared with the PhoneNumber field type on the models
+_E164 = re.compile(E164_PATTERN)
 
 # Currency codes (ISO 4217)
 VALID_CURRENCIES = {
@@ -251,10 +255,7 @@ def validate_e164_phone(phone: str) -> None:
     Raises:
         ValidationError: If phone number is invalid
     """
-    # E.164 pattern: + followed by 1-3 digit country code and up to 14 more digits
-    e164_pattern = r"^\+[1-9]\d{1,14}$"
-
-    if not re.match(e164_pattern, phone):
+    if not _E164.match(phone):
         raise ValidationError(
             f"Invalid phone number format. Must be in E.164 format (e.g., +254712345678): {phone}"
         )
@@ -295,10 +296,7 @@ def validate_country_code(country_code: str) -> None:
     Raises:
         ValidationError: If country code is invalid
     """
-    if not country_code or len(country_code) != 2:
+    if not country_code or country_code.upper() not in ISO_3166_ALPHA2:
         raise ValidationError(
             f"Invalid country code: {country_code}. Must be 2-letter ISO 3166-1 alpha-2 code"
         )
-
-    if not country_code.isalpha():
-        raise ValidationError(f"Country code must contain only letters: {country_code}")
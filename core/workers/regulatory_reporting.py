@@ -11,7 +11,7 @@ This worker handles:
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 from ..repositories.formance import FormanceRepository
@@ -121,7 +121,7 @@ class RegulatoryReportingWorker:
                     continue
 
                 # Query transactions from previous day
-                yesterday = datetime.utcnow() - timedelta(days=1)
+                yesterday = datetime.now(UTC) - timedelta(days=1)
                 day_start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
                 day_end = day_start + timedelta(days=1)
 
@@ -5,7 +5,7 @@ Use these factories in your tests to create consistent test data.
 """
 
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import uuid4
 
@@ -35,7 +35,7 @@ class CustomerFactory:
             address=kwargs.get("address"),
             status=kwargs.get("status", CustomerStatus.ACTIVE),
             kyc_status=kwargs.get("kyc_status", KYCStatus.NOT_STARTED),
-            created_at=kwargs.get("created_at", datetime.utcnow()),
+            created_at=kwargs.get("created_at", datetime.now(UTC)),
             metadata=kwargs.get("metadata", {}),
         )
 
@@ -93,7 +93,7 @@ class AccountFactory:
             balance=kwargs.get("balance", Decimal("0")),
             available_balance=kwargs.get("available_balance", Decimal("0")),
             status=kwargs.get("status", AccountStatus.ACTIVE),
-            created_at=kwargs.get("created_at", datetime.utcnow()),
+            created_at=kwargs.get("created_at", datetime.now(UTC)),
             metadata=kwargs.get("metadata", {}),
         )
 
@@ -134,8 +134,8 @@ class TransactionFactory:
             status=kwargs.get("status", TransactionStatus.COMPLETED),
             description=kwargs.get("description", "Test transaction"),
             reference=kwargs.get("reference"),
-            created_at=kwargs.get("created_at", datetime.utcnow()),
-            completed_at=kwargs.get("completed_at", datetime.utcnow()),
+            created_at=kwargs.get("created_at", datetime.now(UTC)),
+            completed_at=kwargs.get("completed_at", datetime.now(UTC)),
             metadata=kwargs.get("metadata", {}),
         )
 
@@ -207,7 +207,7 @@ class PaymentFactory:
             description=kwargs.get("description", "Test payment"),
             reference=kwargs.get("reference"),
             transaction_id=kwargs.get("transaction_id"),
-            created_at=kwargs.get("created_at", datetime.utcnow()),
+            created_at=kwargs.get("created_at", datetime.now(UTC)),
             metadata=kwargs.get("metadata", {}),
         )
 
@@ -267,7 +267,7 @@ class CardFactory:
             expiry_year=kwargs.get("expiry_year", datetime.now().year + 2),
             status=kwargs.get("status", CardStatus.ACTIVE),
             spending_limit=kwargs.get("spending_limit"),
-            created_at=kwargs.get("created_at", datetime.utcnow()),
+            created_at=kwargs.get("created_at", datetime.now(UTC)),
             metadata=kwargs.get("metadata", {}),
         )
 
@@ -3,10 +3,31 @@ Unit tests for domain models
 """
 
 from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
 
 from core.models.account import Account, AccountStatus, AccountType
 from core.models.customer import Customer, CustomerStatus, KYCStatus
+from core.models.payment import MobileMoneyDestination, MobileMoneyProvider, Payment, PaymentMethod
+from core.models.rules import (
+    ComplianceRule,
+    RuleAction,
+    RuleCondition,
+    RuleConditionOperator,
+    RuleSet,
+    RuleSeverity,
+    RuleType,
+)
 from core.models.transaction import Transaction, TransactionStatus, TransactionType
+from core.models.user import (
+    ROLE_PERMISSIONS,
+    Permission,
+    User,
+    UserRole,
+    roles_with_permission,
+)
 
 
 class TestAccountModel:
@@ -84,6 +105,21 @@ class TestTransactionModel:
         assert transaction.is_completed() is True
         assert transaction.is_pending() is False
 
+    def test_amount_stored_as_minor_units(self):
+        """Test decimal amounts are stored as integer minor units"""
+        transaction = Transaction(
+            id="txn_123",
+            organization_id="org_123",
+            branch_id="br_123",
+            transaction_type=TransactionType.DEPOSIT,
+            to_account_id="acc_dest",
+            amount=Decimal("100.25"),
+        )
+
+        assert transaction.amount_minor == 10025
+        assert transaction.amount == Decimal("100.25")
+        assert transaction.is_pending() is True
+
 
 class TestCustomerModel:
     """Tests for Customer model"""
@@ -126,3 +162,365 @@ class TestCustomerModel:
         )
 
         assert customer.can_transact() is False
+
+    def test_customer_address_round_trip(self):
+        """Test the flat address fields serialize only as the nested address"""
+        customer = Customer(
+            id="cust_123",
+            organization_id="org_123",
+            branch_id="br_123",
+            email="test@example.com",
+            first_name="John",
+            last_name="Doe",
+            address={
+                "street": "1 Main St",
+                "city": "Springfield",
+                "state": "IL",
+                "postal_code": "62701",
+                "country": "US",
+            },
+        )
+
+        assert customer.address_city == "Springfield"
+        data = customer.model_dump()
+        assert data["address"]["city"] == "Springfield"
+        assert not any(key.startswith("address_") for key in data)
+        assert Customer(**data).address == customer.address
+
+    def test_customer_full_name_follows_copies(self):
+        """Test full_name reflects names changed through model_copy"""
+        customer = Customer(
+            id="cust_123",
+            organization_id="org_123",
+            branch_id="br_123",
+            email="test@example.com",
+            first_name="John",
+            last_name="Doe",
+        )
+
+        assert customer.full_name == "John Doe"
+        assert customer.model_copy(update={"first_name": "Jane"}).full_name == "Jane Doe"
+
+    def test_customer_partial_address_rejected(self):
+        """Test nested addresses must be complete"""
+        with pytest.raises(ValidationError):
+            Customer(
+                id="cust_123",
+                organization_id="org_123",
+                branch_id="br_123",
+                email="test@example.com",
+                first_name="John",
+                last_name="Doe",
+                address={"city": "Springfield", "country": "US"},
+            )
+
+
+class TestPaymentModel:
+    """Tests for Payment model"""
+
+    def _payment(self, **kwargs):
+        return Payment(
+            id="pay_123",
+            organization_id="org_123",
+            branch_id="br_123",
+            from_account_id="acc_123",
+            payment_method=PaymentMethod.ACH,
+            destination="acc_456",
+            **kwargs,
+        )
+
+    def test_amount_stored_as_minor_units(self):
+        """Test decimal amounts are stored as integer minor units"""
+        payment = self._payment(amount=Decimal("10.50"))
+
+        assert payment.amount_minor == 1050
+        assert payment.amount == Decimal("10.50")
+
+    def test_amount_respects_currency_exponent(self):
+        """Test zero-decimal currencies"""
+        payment = self._payment(amount=Decimal("500"), currency="JPY", currency_exponent=0)
+
+        assert payment.amount_minor == 500
+        assert payment.amount == Decimal("500")
+
+    def test_amount_exponent_derived_from_currency(self):
+        """Test the exponent comes from the currency code when omitted"""
+        payment = self._payment(amount=Decimal("500"), currency="JPY")
+
+        assert payment.currency_exponent == 0
+        assert payment.amount_minor == 500
+
+    def test_amount_conflicting_with_amount_minor_rejected(self):
+        """Test an amount that disagrees with amount_minor fails validation"""
+        with pytest.raises(ValidationError):
+            self._payment(amount=Decimal("10.50"), amount_minor=999)
+
+    def test_amount_round_trips_through_model_dump(self):
+        """Test a dump with both amount and amount_minor validates again"""
+        payment = self._payment(amount=Decimal("10.50"))
+
+        assert Payment.model_validate(payment.model_dump()) == payment
+
+    def test_amount_from_attributes(self):
+        """Test objects carrying a decimal amount validate from attributes"""
+        row = SimpleNamespace(
+            id="pay_123",
+            organization_id="org_123",
+            branch_id="br_123",
+            from_account_id="acc_123",
+            payment_method=PaymentMethod.ACH,
+            destination="acc_456",
+            amount=Decimal("10.50"),
+        )
+
+        payment = Payment.model_validate(row, from_attributes=True)
+
+        assert payment.amount_minor == 1050
+
+    def test_amount_with_excess_precision_rejected(self):
+        """Test amounts finer than the currency's minor unit are rejected"""
+        with pytest.raises(ValidationError):
+            self._payment(amount=Decimal("1.234"))
+
+    @pytest.mark.parametrize("amount", ["Infinity", "-Infinity", "NaN"])
+    def test_non_finite_amount_rejected(self, amount):
+        """Test infinite and NaN amounts fail validation"""
+        with pytest.raises(ValidationError):
+            self._payment(amount=amount)
+
+    def test_mobile_money_destination_string_follows_copies(self):
+        """Test copies with a new phone number don't reuse the cached destination string"""
+        destination = MobileMoneyDestination(
+            phone_number="+233201234567",
+            provider=MobileMoneyProvider.MTN_MOBILE_MONEY,
+            country_code="GH",
+        )
+
+        assert destination.to_destination_string() == "mtn:GH:+233201234567"
+        copied = destination.model_copy(update={"phone_number": "+233209876543"})
+        assert copied.to_destination_string() == "mtn:GH:+233209876543"
+
+    def test_mobile_money_country_code_normalized(self):
+        """Test lower-case country codes are accepted and stored upper-case"""
+        destination = MobileMoneyDestination(
+            phone_number="+233201234567",
+            provider=MobileMoneyProvider.MTN_MOBILE_MONEY,
+            country_code="gh",
+        )
+
+        assert destination.country_code == "GH"
+        with pytest.raises(ValidationError):
+            MobileMoneyDestination.model_validate(
+                {**destination.model_dump(), "country_code": "xx"}
+            )
+
+
+class TestComplianceRule:
+    """Test compiled compliance rule evaluation"""
+
+    def _rule(self, conditions, **kwargs):
+        kwargs.setdefault("id", "rule_123")
+        return ComplianceRule(
+            name="High value",
+            description="Flag large transfers",
+            rule_type=RuleType.AMOUNT_THRESHOLD,
+            conditions=conditions,
+            action=RuleAction.REVIEW,
+            severity=RuleSeverity.HIGH,
+            **kwargs,
+        )
+
+    def test_and_conditions(self):
+        """Test all conditions must match under AND"""
+        rule = self._rule(
+            [
+                RuleCondition(
+                    field="amount",
+                    operator=RuleConditionOperator.GREATER_THAN,
+                    value=10000,
+                    value_type="number",
+                ),
+                RuleCondition(
+                    field="country_code", operator=RuleConditionOperator.IN, value=["IR", "KP"]
+                ),
+            ]
+        )
+
+        assert rule.evaluate({"amount": Decimal("15000"), "country_code": "KP"})
+        assert not rule.evaluate({"amount": Decimal("15000"), "country_code": "US"})
+        assert not rule.evaluate({"country_code": "KP"})
+        # Frozen together with the cached matcher, so conditions can't drift from it
+        assert isinstance(rule.conditions, tuple)
+
+    def test_or_conditions(self):
+        """Test any condition may match under OR"""
+        rule = self._rule(
+            [
+                RuleCondition(
+                    field="reference", operator=RuleConditionOperator.MATCHES_REGEX, value="^INV-"
+                ),
+                RuleCondition(
+                    field="amount",
+                    operator=RuleConditionOperator.BETWEEN,
+                    value=[9000, 9999],
+                    value_type="number",
+                ),
+            ],
+            conditions_logic="OR",
+        )
+
+        assert rule.evaluate({"reference": "INV-42"})
+        assert rule.evaluate({"amount": 9500})
+        assert not rule.evaluate({"reference": "PO-1", "amount": 100})
+        assert rule.evaluate_batch(
+            [{"reference": "INV-42"}, {"amount": 9500}, {"reference": "PO-1", "amount": 100}]
+        ) == [True, True, False]
+
+    def test_number_condition_keeps_decimal_precision(self):
+        """Test money amounts are compared without a float round trip"""
+        condition = RuleCondition(
+            field="amount",
+            operator=RuleConditionOperator.GREATER_THAN,
+            value="10000.00",
+            value_type="number",
+        )
+
+        assert condition.evaluate({"amount": Decimal("10000.000000000000000001")})
+        assert not condition.evaluate({"amount": Decimal("10000")})
+        assert not condition.evaluate({"amount": 10000.0})
+
+    def test_copy_with_updates_recompiles_matcher(self):
+        """Test copies with new conditions or values don't reuse the cached matcher"""
+        condition = RuleCondition(
+            field="amount",
+            operator=RuleConditionOperator.GREATER_THAN,
+            value=10000,
+            value_type="number",
+        )
+        rule = self._rule([condition])
+        assert rule.evaluate({"amount": 15000})
+
+        lowered = condition.model_copy(update={"value": 100})
+        assert condition.evaluate({"amount": 5000}) is False
+        assert lowered.evaluate({"amount": 5000}) is True
+        assert rule.model_copy(update={"conditions": (lowered,)}).evaluate({"amount": 5000})
+
+    def test_disabled_or_empty_rule_never_triggers(self):
+        """Test disabled rules and rules without conditions"""
+        condition = RuleCondition(
+            field="kyc_status", operator=RuleConditionOperator.NOT_EQUALS, value="verified"
+        )
+
+        assert not self._rule([condition], enabled=False).evaluate({"kyc_status": "pending"})
+        assert not self._rule([]).evaluate({"kyc_status": "pending"})
+
+    def test_unknown_conditions_logic_rejected(self):
+        """Test conditions_logic is validated at construction"""
+        with pytest.raises(ValidationError):
+            self._rule([], conditions_logic="XOR")
+
+    def test_rule_set_compiles_in_priority_order(self):
+        """Test rule sets resolve enabled rules by priority and stop early"""
+        condition = RuleCondition(
+            field="kyc_status", operator=RuleConditionOperator.NOT_EQUALS, value="verified"
+        )
+        rules = {
+            "low": self._rule([condition], id="low", priority=500),
+            "high": self._rule([condition], id="high", priority=10),
+            "off": self._rule([condition], id="off", priority=1, enabled=False),
+        }
+        rule_set = RuleSet(
+            id="set_123",
+            name="KYC",
+            description="KYC rules",
+            rule_ids=["low", "off", "high", "missing"],
+            stop_on_first_trigger=True,
+        )
+
+        compiled = rule_set.compile(rules)
+
+        assert [rule.id for rule in compiled] == ["high", "low"]
+        assert [rule.id for rule in rule_set.evaluate(compiled, {"kyc_status": "pending"})] == [
+            "high"
+        ]
+
+
+class TestUserModel:
+    """Test User model permissions"""
+
+    def _user(self, **kwargs):
+        return User(
+            id="user_123",
+            organization_id="org_123",
+            email="jane@example.com",
+            first_name="Jane",
+            last_name="Doe",
+            **kwargs,
+        )
+
+    def test_role_and_custom_permissions(self):
+        """Test effective permissions combine role and custom grants"""
+        user = self._user(role=UserRole.VIEWER, permissions=[Permission.AUDIT_READ])
+
+        assert user.has_permission(Permission.REPORTS_VIEW)
+        assert user.has_permission(Permission.AUDIT_READ)
+        assert not user.has_permission(Permission.USERS_DELETE)
+        assert set(user.get_all_permissions()) >= {Permission.AUDIT_READ, Permission.ACCOUNTS_READ}
+
+    def test_any_and_all_permissions(self):
+        """Test permission set checks"""
+        user = self._user(role=UserRole.ACCOUNTANT)
+
+        assert user.has_any_permission([Permission.USERS_DELETE, Permission.AUDIT_READ])
+        assert not user.has_any_permission([Permission.USERS_DELETE])
+        assert user.has_all_permissions([Permission.ACCOUNTS_READ, Permission.REPORTS_EXPORT])
+        assert not user.has_all_permissions([Permission.ACCOUNTS_READ, Permission.ORG_UPDATE])
+
+    def test_branch_access(self):
+        """Test branch access for scoped and organization-wide users"""
+        scoped = self._user(role=UserRole.SUPPORT, accessible_branches=["br_1", "br_2"])
+        org_wide = self._user(role=UserRole.SUPPORT)
+
+        assert scoped.has_branch_access("br_2")
+        assert not scoped.has_branch_access("br_3")
+        assert org_wide.has_branch_access("br_3")
+
+    def test_super_admin_has_every_permission(self):
+        """Test super admins short-circuit permission checks"""
+        user = self._user(role=UserRole.SUPER_ADMIN)
+
+        assert user.has_permission(Permission.COMPLIANCE_OVERRIDE)
+        assert user.has_all_permissions(list(Permission))
+        assert set(user.get_all_permissions()) == set(Permission)
+
+    def test_roles_with_permission(self):
+        """Test the inverse role index"""
+        roles = roles_with_permission(Permission.COMPLIANCE_OVERRIDE)
+
+        assert roles == {UserRole.SUPER_ADMIN, UserRole.ORG_OWNER}
+
+    def test_copy_with_new_role_drops_cached_permissions(self):
+        """Test model_copy(update=...) re-derives permissions and branch access"""
+        admin = self._user(role=UserRole.SUPER_ADMIN, accessible_branches=["br_1"])
+        assert admin.has_any_permission([Permission.USERS_DELETE])
+        assert admin.perm_check(Permission.USERS_DELETE)
+        assert not admin.has_branch_access("br_2")
+
+        viewer = admin.model_copy(
+            update={"role": UserRole.VIEWER, "accessible_branches": ("br_2",)}
+        )
+
+        assert not viewer.has_any_permission([Permission.USERS_DELETE])
+        assert not viewer.perm_check(Permission.USERS_DELETE)
+        assert set(viewer.get_all_permissions()) == ROLE_PERMISSIONS[UserRole.VIEWER]
+        assert viewer.has_branch_access("br_2")
+        assert not viewer.has_branch_access("br_1")
+
+    def test_perm_check(self):
+        """Test the cached bound permission check"""
+        user = self._user(role=UserRole.VIEWER, permissions=[Permission.AUDIT_READ])
+        check = user.perm_check
+
+        assert check is user.perm_check
+        assert check(Permission.REPORTS_VIEW) and check(Permission.AUDIT_READ)
+        assert not check(Permission.USERS_DELETE)
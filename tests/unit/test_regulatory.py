@@ -2,11 +2,12 @@
 Unit tests for regulatory reporting functionality
 """
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 
 from core.exceptions import ValidationError
 from core.models.compliance import (
@@ -23,6 +24,8 @@ from core.models.regulatory import (
     ReportType,
     SuspiciousActivityReport,
     SuspiciousActivityType,
+    TransactionBatch,
+    TransactionDetails,
 )
 from core.services.regulatory import RegulatoryReportingService
 
@@ -74,7 +77,7 @@ async def test_check_ctr_required_above_threshold(regulatory_service):
     result = await regulatory_service.check_ctr_required(
         organization_id="org_test",
         customer_id="cust_test",
-        transaction_date=datetime.utcnow(),
+        transaction_date=datetime.now(UTC),
         amount=Decimal("15000.00"),
         currency="USD",
     )
@@ -88,7 +91,7 @@ async def test_check_ctr_not_required_below_threshold(regulatory_service):
     result = await regulatory_service.check_ctr_required(
         organization_id="org_test",
         customer_id="cust_test",
-        transaction_date=datetime.utcnow(),
+        transaction_date=datetime.now(UTC),
         amount=Decimal("5000.00"),
         currency="USD",
     )
@@ -96,6 +99,36 @@ async def test_check_ctr_not_required_below_threshold(regulatory_service):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_scan_aggregated_transactions_flags_structuring(regulatory_service):
+    """Test sub-threshold transactions adding up within the window are flagged"""
+    start = datetime(2024, 1, 1, 9, 0)
+    transactions = [
+        TransactionDetails(
+            transaction_id=f"txn_{i}",
+            transaction_date=start + timedelta(hours=i),
+            transaction_type="cash_deposit",
+            amount=Decimal("4000.00"),
+        )
+        for i in range(3)
+    ]
+    transactions.append(
+        TransactionDetails(
+            transaction_id="txn_large",
+            transaction_date=start + timedelta(days=3),
+            transaction_type="cash_deposit",
+            amount=Decimal("12000.00"),
+        )
+    )
+
+    result = await regulatory_service.scan_aggregated_transactions(
+        organization_id="org_test", transactions=transactions
+    )
+
+    assert result["ctr"] == ["txn_2", "txn_large"]
+    assert result["structuring"] == ["txn_2"]
+
+
 @pytest.mark.asyncio
 async def test_check_sar_required_high_risk(regulatory_service):
     """Test SAR requirement check for high-risk transaction"""
@@ -168,7 +201,7 @@ async def test_generate_sar_success(regulatory_service):
         "Multiple deposits just under $10,000 over the past week.",
         transaction_ids=["txn_1", "txn_2", "txn_3"],
         prepared_by="user_compliance",
-        activity_start_date=datetime.utcnow() - timedelta(days=7),
+        activity_start_date=datetime.now(UTC) - timedelta(days=7),
         priority=ReportPriority.HIGH,
     )
 
@@ -192,7 +225,7 @@ async def test_generate_sar_narrative_too_short(regulatory_service):
             narrative_summary="Too short",
             transaction_ids=["txn_1"],
             prepared_by="user_compliance",
-            activity_start_date=datetime.utcnow(),
+            activity_start_date=datetime.now(UTC),
         )
 
 
@@ -281,9 +314,46 @@ def test_reporting_config_defaults():
     assert config.report_retention_days == 1825  # 5 years
 
 
+def test_compliance_check_metadata_is_writable():
+    """Test unset metadata on mutable compliance models is a fresh dict per instance"""
+    first = ComplianceCheck(
+        id="chk_1",
+        organization_id="org_test",
+        check_type=ComplianceCheckType.KYC,
+        status=ComplianceStatus.APPROVED,
+    )
+    second = ComplianceCheck(
+        id="chk_2",
+        organization_id="org_test",
+        check_type=ComplianceCheckType.KYC,
+        status=ComplianceStatus.APPROVED,
+    )
+
+    first.metadata["reviewed"] = True
+    first.details["source"] = "manual"
+
+    assert second.metadata == {}
+    assert second.details == {}
+
+
+def test_reporting_config_threshold_cents_follows_copies():
+    """Test the integer CTR threshold tracks threshold updates made through model_copy"""
+    config = RegulatoryReportingConfig(organization_id="org_test")
+
+    assert config.ctr_threshold_cents == 1000000
+    raised = config.model_copy(update={"ctr_threshold": Decimal("15000.00")})
+    assert raised.ctr_threshold_cents == 1500000
+
+
+def test_reporting_config_rejects_empty_aggregation_window():
+    """Test the CTR aggregation window must cover at least an hour"""
+    with pytest.raises(PydanticValidationError):
+        RegulatoryReportingConfig(organization_id="org_test", ctr_aggregation_window_hours=0)
+
+
 def test_ctr_model_validation():
     """Test CTR model validation"""
-    from core.models.regulatory import FinancialInstitution, SubjectInformation, TransactionDetails
+    from core.models.regulatory import FinancialInstitution, IndividualSubject, TransactionDetails
 
     filing_institution = FinancialInstitution(
         name="Test Bank",
@@ -294,8 +364,7 @@ def test_ctr_model_validation():
         phone="+1234567890",
     )
 
-    person = SubjectInformation(
-        entity_type="individual",
+    person = IndividualSubject(
         first_name="John",
         last_name="Doe",
         relationship="customer",
@@ -303,7 +372,7 @@ def test_ctr_model_validation():
 
     txn = TransactionDetails(
         transaction_id="txn_test",
-        transaction_date=datetime.utcnow(),
+        transaction_date=datetime.now(UTC),
         transaction_type="deposit",
         amount=Decimal("15000.00"),
         currency="USD",
@@ -313,7 +382,7 @@ def test_ctr_model_validation():
         id="ctr_test",
         organization_id="org_test",
         filing_institution=filing_institution,
-        transaction_date=datetime.utcnow(),
+        transaction_date=datetime.now(UTC),
         person_on_behalf=person,
         transactions=[txn],
         total_amount=Decimal("15000.00"),
@@ -326,13 +395,13 @@ def test_ctr_model_validation():
     )
 
     assert ctr.id == "ctr_test"
-    assert ctr.status == ReportStatus.DRAFT
+    assert ctr.status is ReportStatus.DRAFT
     assert ctr.total_amount == Decimal("15000.00")
 
 
 def test_sar_model_validation():
     """Test SAR model validation"""
-    from core.models.regulatory import FinancialInstitution, SubjectInformation, TransactionDetails
+    from core.models.regulatory import FinancialInstitution, IndividualSubject, TransactionDetails
 
     filing_institution = FinancialInstitution(
         name="Test Bank",
@@ -343,8 +412,7 @@ def test_sar_model_validation():
         phone="+1234567890",
     )
 
-    subject = SubjectInformation(
-        entity_type="individual",
+    subject = IndividualSubject(
         first_name="Jane",
         last_name="Smith",
         relationship="customer",
@@ -352,7 +420,7 @@ def test_sar_model_validation():
 
     txn = TransactionDetails(
         transaction_id="txn_test",
-        transaction_date=datetime.utcnow(),
+        transaction_date=datetime.now(UTC),
         transaction_type="transfer",
         amount=Decimal("9000.00"),
         currency="USD",
@@ -362,8 +430,8 @@ def test_sar_model_validation():
         id="sar_test",
         organization_id="org_test",
         filing_institution=filing_institution,
-        activity_start_date=datetime.utcnow() - timedelta(days=7),
-        activity_detected_date=datetime.utcnow(),
+        activity_start_date=datetime.now(UTC) - timedelta(days=7),
+        activity_detected_date=datetime.now(UTC),
         subjects=[subject],
         suspicious_activity_types=[SuspiciousActivityType.STRUCTURING],
         transactions=[txn],
@@ -373,7 +441,53 @@ def test_sar_model_validation():
     )
 
     assert sar.id == "sar_test"
-    assert sar.status == ReportStatus.DRAFT
-    assert sar.priority == ReportPriority.NORMAL
+    assert sar.status is ReportStatus.DRAFT
+    assert sar.priority is ReportPriority.NORMAL
     assert len(sar.subjects) == 1
     assert len(sar.suspicious_activity_types) == 1
+
+
+def test_transaction_details_amount_cents_rounds_half_up():
+    """Test sub-cent amounts round to the nearest cent instead of truncating"""
+    txn_date = datetime(2024, 1, 1, 9, 0)
+
+    def cents(amount):
+        return TransactionDetails(
+            transaction_id="txn_test",
+            transaction_date=txn_date,
+            transaction_type="cash_deposit",
+            amount=Decimal(amount),
+        ).amount_cents
+
+    assert cents("9000.005") == 900001
+    assert cents("9000.004") == 900000
+    assert cents("12000") == 1200000
+
+
+def test_transaction_batch_window_totals():
+    """Test trailing window sums and CTR breaches over a transaction batch"""
+    start = datetime(2024, 1, 1, 9, 0)
+    batch = TransactionBatch.from_details(
+        TransactionDetails(
+            transaction_id=f"txn_{i}",
+            transaction_date=start + offset,
+            transaction_type="cash_deposit",
+            amount=amount,
+        )
+        for i, (offset, amount) in enumerate(
+            [
+                (timedelta(hours=20), Decimal("2000.00")),
+                (timedelta(0), Decimal("4000.00")),
+                (timedelta(hours=6), Decimal("5000.00")),
+                (timedelta(hours=30), Decimal("3000.00")),
+            ]
+        )
+    )
+
+    assert batch.transaction_ids == ("txn_1", "txn_2", "txn_0", "txn_3")
+    assert batch.window_totals(24 * 3600) == [400000, 900000, 1100000, 500000]
+    assert batch.ctr_breaches(24 * 3600, 1000000) == ["txn_0"]
+    assert TransactionBatch.from_details([]).window_totals(3600) == []
+    # A window that excludes every transaction sums to zero instead of overrunning
+    assert batch.window_totals(0) == [0, 0, 0, 0]
+    assert batch.structuring_breaches(-3600, 1000000) == []
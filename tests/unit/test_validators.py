@@ -13,7 +13,9 @@ from core.exceptions import (
 )
 from core.utils.validators import (
     validate_amount,
+    validate_country_code,
     validate_currency,
+    validate_e164_phone,
     validate_email,
     validate_phone,
     validate_routing_number,
@@ -98,6 +100,22 @@ class TestPhoneValidator:
         with pytest.raises(ValidationError):
             validate_phone("abc1234567")  # Contains letters
 
+    def test_valid_e164_phone(self):
+        """Test valid E.164 phone numbers"""
+        validate_e164_phone("+254712345678")
+        validate_e164_phone("+12")  # Shortest form accepted
+
+    def test_invalid_e164_phone(self):
+        """Test invalid E.164 phone numbers"""
+        with pytest.raises(ValidationError):
+            validate_e164_phone("254712345678")  # Missing "+"
+
+        with pytest.raises(ValidationError):
+            validate_e164_phone("+0712345678")  # Leading zero
+
+        with pytest.raises(ValidationError):
+            validate_e164_phone("+1234567890123456")  # More than 15 digits
+
 
 class TestRoutingNumberValidator:
     """Tests for routing number validation"""
@@ -129,3 +147,17 @@ class TestSwiftCodeValidator:
         """Test invalid SWIFT code format"""
         with pytest.raises(ValidationError):
             validate_swift_code("1234DEFF")  # Should start with letters
+
+
+class TestCountryCodeValidator:
+    """Tests for country code validation"""
+
+    def test_valid_country_code(self):
+        """Test assigned codes pass in either case"""
+        validate_country_code("US")
+        validate_country_code("gh")
+
+    def test_unassigned_country_code(self):
+        """Test two-letter codes outside ISO 3166-1 are rejected"""
+        with pytest.raises(ValidationError):
+            validate_country_code("XX")